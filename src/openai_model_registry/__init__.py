@@ -54,6 +54,13 @@ from .logging import (
 )
 from .model_version import ModelVersion
 from .registry import (
+    SUPPORTS_AUDIO,
+    SUPPORTS_FUNCTIONS,
+    SUPPORTS_JSON_MODE,
+    SUPPORTS_STREAMING,
+    SUPPORTS_STRUCTURED,
+    SUPPORTS_VISION,
+    SUPPORTS_WEB_SEARCH,
     ModelCapabilities,
     ModelRegistry,
     RegistryConfig,
@@ -71,6 +78,14 @@ __all__ = [
     "WebSearchBilling",
     "RegistryConfig",
     "get_registry",
+    # Capability flags
+    "SUPPORTS_VISION",
+    "SUPPORTS_FUNCTIONS",
+    "SUPPORTS_STREAMING",
+    "SUPPORTS_STRUCTURED",
+    "SUPPORTS_WEB_SEARCH",
+    "SUPPORTS_AUDIO",
+    "SUPPORTS_JSON_MODE",
     # Version handling
     "ModelVersion",
     "RegistryUpdateStatus",
@@ -19,6 +19,9 @@ from ..formatters import (
 )
 from ..utils import ExitCode, get_omr_env_vars, handle_error
 
+# Use the libyaml-backed loader when PyYAML was built with it
+_YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 
 def _get_file_etag(file_path: Path) -> Optional[str]:
     """Get etag information for a file if available.
@@ -227,13 +230,13 @@ def dump(
 
                 for file_type, path in raw_paths.items():
                     if path and Path(path).exists():
-                        with open(path, "r") as f:
-                            raw_data[file_type] = yaml.safe_load(f)
+                        with open(path, "rb") as f:
+                            raw_data[file_type] = yaml.load(f, Loader=_YamlLoader)
                     else:
                         # Try to get bundled content using public API
                         content = registry.get_bundled_data_content(f"{file_type}.yaml")
                         if content:
-                            raw_data[file_type] = yaml.safe_load(content)
+                            raw_data[file_type] = yaml.load(content, Loader=_YamlLoader)
 
                 data_to_output = raw_data
             else:
@@ -41,6 +41,14 @@ def get_user_data_dir() -> Path:
     return Path(platformdirs.user_data_dir(APP_NAME))
 
 
+def get_user_cache_dir() -> Path:
+    """Get the path to the user's cache directory for this application.
+
+    Used for derived files that can be regenerated at any time.
+    """
+    return Path(platformdirs.user_cache_dir(APP_NAME))
+
+
 def ensure_user_data_dir_exists() -> None:
     """Ensure that the user data directory exists.
 
@@ -4,23 +4,34 @@ This module defines the constraint types used to validate parameters for model c
 """
 
 import math
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import (
     Any,
     List,
+    Mapping,
     Optional,
 )
 
 from .errors import ModelRegistryError
 
 
-@dataclass
+@dataclass(frozen=True)
 class ParameterReference:
-    """Reference to a parameter constraint with optional metadata."""
+    """Reference to a parameter constraint with optional metadata.
+
+    Instances are immutable because the registry shares one reference per
+    parameter name between all models that accept it.
+    """
 
     ref: str
     description: str = ""
     max_value: Optional[float] = None
+    # Name after the last dot of ``ref`` (e.g. "temperature"), derived once
+    short_name: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        """Derive the short parameter name from the reference."""
+        object.__setattr__(self, "short_name", self.ref.rsplit(".", 1)[-1])
 
 
 class NumericConstraint:
@@ -49,6 +60,37 @@ class NumericConstraint:
         self.allow_int = allow_int
         self.description = description
 
+    @classmethod
+    def from_mapping(cls, data: Mapping[str, Any]) -> "NumericConstraint":
+        """Build a numeric constraint from its configuration mapping.
+
+        Args:
+            data: Constraint definition from the constraints file
+
+        Returns:
+            The constraint
+
+        Raises:
+            ValueError: If a field has the wrong type
+        """
+        min_value = data.get("min_value")
+        max_value = data.get("max_value")
+        allow_float = data.get("allow_float", True)
+        allow_int = data.get("allow_int", True)
+        if min_value is not None and not isinstance(min_value, (int, float)):
+            raise ValueError("has non-numeric 'min_value' value")
+        if max_value is not None and not isinstance(max_value, (int, float)):
+            raise ValueError("has non-numeric 'max_value' value")
+        if not isinstance(allow_float, bool) or not isinstance(allow_int, bool):
+            raise ValueError("has non-boolean 'allow_float' or 'allow_int'")
+        return cls(
+            min_value=min_value if min_value is not None else 0.0,
+            max_value=max_value,
+            allow_float=allow_float,
+            allow_int=allow_int,
+            description=data.get("description", ""),
+        )
+
     def validate(self, name: str, value: Any) -> None:
         """Validate a value against this constraint.
 
@@ -120,6 +162,28 @@ class EnumConstraint:
         self.allowed_values = allowed_values
         self.description = description
 
+    @classmethod
+    def from_mapping(cls, data: Mapping[str, Any]) -> "EnumConstraint":
+        """Build an enum constraint from its configuration mapping.
+
+        Args:
+            data: Constraint definition from the constraints file
+
+        Returns:
+            The constraint
+
+        Raises:
+            ValueError: If ``allowed_values`` is missing or not a list of strings
+        """
+        allowed_values = data.get("allowed_values")
+        if allowed_values is None:
+            raise ValueError("missing required 'allowed_values' field")
+        if not isinstance(allowed_values, list):
+            raise ValueError("has non-list 'allowed_values' field")
+        if not all(isinstance(val, str) for val in allowed_values):
+            raise ValueError("has non-string values in 'allowed_values' list")
+        return cls(allowed_values=allowed_values, description=data.get("description", ""))
+
     def validate(self, name: str, value: Any) -> None:
         """Validate a value against this constraint.
 
@@ -165,6 +229,31 @@ class ObjectConstraint:
         self.required_keys = required_keys or []
         self.allowed_keys = allowed_keys
 
+    @classmethod
+    def from_mapping(cls, data: Mapping[str, Any]) -> "ObjectConstraint":
+        """Build an object constraint from its configuration mapping.
+
+        Args:
+            data: Constraint definition from the constraints file
+
+        Returns:
+            The constraint
+
+        Raises:
+            ValueError: If a key list has the wrong type
+        """
+        required_keys = data.get("required_keys", [])
+        allowed_keys = data.get("allowed_keys")
+        if not isinstance(required_keys, list):
+            raise ValueError("has non-list 'required_keys' field")
+        if allowed_keys is not None and not isinstance(allowed_keys, list):
+            raise ValueError("has non-list 'allowed_keys' field")
+        return cls(
+            description=data.get("description", ""),
+            required_keys=required_keys,
+            allowed_keys=allowed_keys,
+        )
+
     def validate(self, name: str, value: Any) -> None:
         """Validate a value against this constraint.
 
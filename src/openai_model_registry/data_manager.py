@@ -4,12 +4,14 @@ This module handles fetching, caching, and managing model registry data files
 from GitHub releases with version tracking and integrity verification.
 """
 
+import functools
 import json
 import os
 import shutil
 import tempfile
 import threading
 from pathlib import Path
+from types import ModuleType
 from typing import Any, Dict, List, Optional, Tuple, cast
 
 try:
@@ -18,17 +20,33 @@ except ImportError:
     # Fallback for Python < 3.9
     import importlib_resources as resources  # type: ignore
 
-try:
-    import requests
-except ImportError:
-    requests = None  # type: ignore
-
 from platformdirs import user_data_dir
 
 from .logging import get_logger
 
 logger = get_logger(__name__)
 
+# ``requests`` (and urllib3/certifi behind it) is by far the most expensive
+# import in the package, yet it is only needed when talking to GitHub.
+_requests: Optional[ModuleType] = None
+
+
+def _get_requests() -> Optional[ModuleType]:
+    """Import ``requests`` on first use.
+
+    Returns:
+        The ``requests`` module, or None if it is not installed.
+    """
+    global _requests
+    if _requests is None:
+        try:
+            import requests
+        except ImportError:
+            return None
+        _requests = requests
+    return _requests
+
+
 # GitHub API configuration
 GITHUB_API_BASE = "https://api.github.com"
 GITHUB_API_FALLBACK_BASES = [
@@ -38,6 +56,11 @@ GITHUB_API_FALLBACK_BASES = [
 GITHUB_REPO = "yaniv-golan/openai-model-registry"
 DATA_RELEASE_TAG_PREFIX = "data-v"
 
+# (connect, read) timeouts in seconds; a short connect cap keeps an unreachable
+# host from stalling the update check for the full read timeout
+API_TIMEOUT = (3.05, 30)
+DOWNLOAD_TIMEOUT = (3.05, 60)
+
 # Environment variables (all prefixed with OMR_)
 ENV_DISABLE_DATA_UPDATES = "OMR_DISABLE_DATA_UPDATES"
 ENV_DATA_VERSION_PIN = "OMR_DATA_VERSION_PIN"
@@ -49,6 +72,40 @@ OVERRIDES_YAML = "overrides.yaml"
 VERSION_INFO_JSON = "version_info.json"
 
 
+@functools.lru_cache(maxsize=8)
+def _read_bundled_data(filename: str) -> Optional[str]:
+    """Read a data file shipped with the package.
+
+    Bundled files cannot change while the package is installed, so the
+    content is read once per process.
+    """
+    try:
+        # Try to load from package data using importlib.resources
+        try:
+            # Use modern importlib.resources API (Python 3.9+)
+            data_package = resources.files("openai_model_registry.data")
+            pkg_file = data_package / filename
+            if pkg_file.is_file():
+                content = pkg_file.read_text()
+
+                # Return content directly - validation handled elsewhere
+                return content
+        except Exception:
+            # Ignore and fall through to filesystem fallback
+            pass
+
+        # Always try filesystem fallback regardless of importlib.resources result
+        bundled_path = Path(__file__).parent.parent.parent / "data" / filename
+        if bundled_path.exists():
+            # Return content directly - validation handled elsewhere
+            with open(bundled_path, "r") as f:
+                return f.read()
+
+    except (OSError, IOError) as e:
+        logger.warning(f"Failed to load bundled data {filename}: {e}")
+    return None
+
+
 class DataManager:
     """Manages model registry data files with automatic updates and caching."""
 
@@ -81,6 +138,7 @@ class DataManager:
 
     def _fetch_latest_data_release(self) -> Optional[Dict[str, Any]]:
         """Fetch information about the latest data release from GitHub API with fallback URLs."""
+        requests = _get_requests()
         if requests is None:
             logger.error("requests module not available - cannot fetch data releases")
             return None
@@ -89,7 +147,7 @@ class DataManager:
         for base_url in GITHUB_API_FALLBACK_BASES:
             try:
                 url = self._get_github_api_url("releases", base_url)
-                response = requests.get(url, timeout=30)
+                response = requests.get(url, timeout=API_TIMEOUT)
                 response.raise_for_status()
 
                 releases = response.json()
@@ -138,6 +196,9 @@ class DataManager:
 
     def _compare_versions(self, version1: str, version2: str) -> int:
         """Compare two version strings. Returns: -1 if v1 < v2, 0 if equal, 1 if v1 > v2."""
+        # Identical tags (the common "already current" case) need no parsing
+        if version1 == version2:
+            return 0
         try:
             v1_parts = self._parse_version(version1)
             v2_parts = self._parse_version(version2)
@@ -190,12 +251,13 @@ class DataManager:
 
     def _download_file(self, url: str, target_path: Path) -> bool:
         """Download a file from URL to target path."""
+        requests = _get_requests()
         if requests is None:
             logger.error("requests module not available - cannot download files")
             return False
 
         try:
-            response = requests.get(url, timeout=60, stream=True)
+            response = requests.get(url, timeout=DOWNLOAD_TIMEOUT, stream=True)
             response.raise_for_status()
 
             with open(target_path, "wb") as f:
@@ -304,31 +366,7 @@ class DataManager:
 
     def _get_bundled_data_content(self, filename: str) -> Optional[str]:
         """Get bundled data file content as fallback."""
-        try:
-            # Try to load from package data using importlib.resources
-            try:
-                # Use modern importlib.resources API (Python 3.9+)
-                data_package = resources.files("openai_model_registry.data")
-                pkg_file = data_package / filename
-                if pkg_file.is_file():
-                    content = pkg_file.read_text()
-
-                    # Return content directly - validation handled elsewhere
-                    return content
-            except Exception:
-                # Ignore and fall through to filesystem fallback
-                pass
-
-            # Always try filesystem fallback regardless of importlib.resources result
-            bundled_path = Path(__file__).parent.parent.parent / "data" / filename
-            if bundled_path.exists():
-                # Return content directly - validation handled elsewhere
-                with open(bundled_path, "r") as f:
-                    return f.read()
-
-        except (OSError, IOError) as e:
-            logger.warning(f"Failed to load bundled data {filename}: {e}")
-        return None
+        return _read_bundled_data(filename)
 
     def get_data_file_path(self, filename: str) -> Optional[Path]:
         """Get the path to a data file, checking user directory first."""
@@ -453,6 +491,7 @@ class DataManager:
 
     def _fetch_all_data_releases(self) -> List[Dict[str, Any]]:
         """Fetch all data releases from GitHub API."""
+        requests = _get_requests()
         if requests is None:
             logger.error("requests module not available - cannot fetch data releases")
             return []
@@ -463,7 +502,7 @@ class DataManager:
         for base_url in GITHUB_API_FALLBACK_BASES:
             try:
                 url = self._get_github_api_url("releases", base_url)
-                response = requests.get(url, timeout=30)
+                response = requests.get(url, timeout=API_TIMEOUT)
                 response.raise_for_status()
 
                 releases = response.json()
@@ -10,6 +10,10 @@ from typing import Tuple
 
 from .errors import InvalidDateError, ModelFormatError
 
+# Format: "{base_model}-{YYYY}-{MM}-{DD}"
+_MODEL_VERSION_PATTERN = re.compile(r"^([\w-]+?)-(\d{4}-\d{2}-\d{2})$")
+_DATED_MODEL_PATTERN = re.compile(r"^.*-\d{4}-\d{2}-\d{2}$")
+
 
 class ModelVersion:
     """Represents a model version in YYYY-MM-DD format.
@@ -56,11 +60,7 @@ class ModelVersion:
         Returns:
             bool: True if this version is earlier, False otherwise
         """
-        if self.year != other.year:
-            return self.year < other.year
-        if self.month != other.month:
-            return self.month < other.month
-        return self.day < other.day
+        return (self.year, self.month, self.day) < (other.year, other.month, other.day)
 
     def __le__(self, other: "ModelVersion") -> bool:
         """Check if this version is earlier than or equal to another.
@@ -71,7 +71,7 @@ class ModelVersion:
         Returns:
             bool: True if this version is earlier or equal, False otherwise
         """
-        return self < other or self == other
+        return (self.year, self.month, self.day) <= (other.year, other.month, other.day)
 
     def __gt__(self, other: "ModelVersion") -> bool:
         """Check if this version is later than another.
@@ -82,7 +82,7 @@ class ModelVersion:
         Returns:
             bool: True if this version is later, False otherwise
         """
-        return not (self <= other)
+        return (self.year, self.month, self.day) > (other.year, other.month, other.day)
 
     def __ge__(self, other: "ModelVersion") -> bool:
         """Check if this version is later than or equal to another.
@@ -93,7 +93,7 @@ class ModelVersion:
         Returns:
             bool: True if this version is later or equal, False otherwise
         """
-        return not (self < other)
+        return (self.year, self.month, self.day) >= (other.year, other.month, other.day)
 
     def __repr__(self) -> str:
         """Get string representation of the version.
@@ -169,9 +169,7 @@ class ModelVersion:
             ModelFormatError: If the model name does not follow the expected format
             InvalidDateError: If the date part of the model name is invalid
         """
-        # Format: "{base_model}-{YYYY}-{MM}-{DD}"
-        pattern = re.compile(r"^([\w-]+?)-(\d{4}-\d{2}-\d{2})$")
-        match = pattern.match(model)
+        match = _MODEL_VERSION_PATTERN.match(model)
 
         if not match:
             raise ModelFormatError(
@@ -201,4 +199,4 @@ class ModelVersion:
         Returns:
             True if the model name follows the dated format (with YYYY-MM-DD suffix)
         """
-        return bool(re.match(r"^.*-\d{4}-\d{2}-\d{2}$", model_name))
+        return bool(_DATED_MODEL_PATTERN.match(model_name))
@@ -15,22 +15,58 @@ Backward-compatibility shims from < v1.0 have been removed.
 
 """
 
+import bisect
 import copy
 import functools
+import hashlib
+import json
 import os
-import re
+import sys
 import threading
+import time
 import typing
+from collections import OrderedDict, deque
 from dataclasses import asdict, dataclass
+from datetime import date, datetime
 from enum import Enum
-from typing import Any, Callable, Dict, List, Literal, NamedTuple, Optional, Set, Union, cast
+from pathlib import Path
+from types import MappingProxyType
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Deque,
+    Dict,
+    FrozenSet,
+    List,
+    Literal,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Set,
+    Tuple,
+    Type,
+    Union,
+    cast,
+)
 
 import yaml
 
+try:  # Prefer the libyaml-backed loader/dumper when PyYAML was built with it
+    from yaml import CSafeDumper as _YamlDumper
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # pragma: no cover - depends on the PyYAML build
+    from yaml import SafeDumper as _YamlDumper  # type: ignore[assignment]
+    from yaml import SafeLoader as _YamlLoader  # type: ignore[assignment]
+
+if TYPE_CHECKING:
+    import requests
+
 from .config_paths import (
     PARAM_CONSTRAINTS_FILENAME,
     copy_default_to_user_config,
     get_parameter_constraints_path,
+    get_user_cache_dir,
     get_user_data_dir,
 )
 from .config_result import ConfigResult
@@ -42,6 +78,7 @@ from .errors import (
     InvalidDateError,
     ModelNotSupportedError,
     ParameterNotSupportedError,
+    ParameterValidationError,
     VersionTooOldError,
 )
 from .logging import LogEvent, get_logger, log_debug, log_error, log_info, log_warning
@@ -51,6 +88,236 @@ from .pricing import PricingInfo
 # Create module logger
 logger = get_logger("registry")
 
+# (connect, read) timeouts in seconds for registry HTTP requests; whole data
+# files downloaded by the refresh fallback get a longer read timeout
+_HTTP_TIMEOUT = (3.05, 10)
+_DOWNLOAD_TIMEOUT = (3.05, 30)
+
+# Raw files on the main branch, used when no update URL is given
+_DEFAULT_REGISTRY_URL = "https://raw.githubusercontent.com/yaniv-golan/openai-model-registry/main/data/models.yaml"
+_DEFAULT_OVERRIDES_URL = "https://raw.githubusercontent.com/yaniv-golan/openai-model-registry/main/data/overrides.yaml"
+_FALLBACK_REGISTRY_URLS = ("https://github.com/yaniv-golan/openai-model-registry/raw/main/data/models.yaml",)
+
+# Directory in the user cache holding one stamp file per (local data, remote
+# URL) whose mtime marks when that remote was last confirmed current, see
+# RegistryConfig.refresh_ttl
+_REMOTE_CHECK_DIR = "remote-checks"
+
+# Byte range requested when only the remote ``version`` key is needed
+_VERSION_PEEK_RANGE = "bytes=0-2047"
+
+# Capability bit flags packed into ModelCapabilities.flags
+SUPPORTS_VISION = 1 << 0
+SUPPORTS_FUNCTIONS = 1 << 1
+SUPPORTS_STREAMING = 1 << 2
+SUPPORTS_STRUCTURED = 1 << 3
+SUPPORTS_WEB_SEARCH = 1 << 4
+SUPPORTS_AUDIO = 1 << 5
+SUPPORTS_JSON_MODE = 1 << 6
+
+# (flag, key under ``capabilities``, legacy top-level key) used by the loader
+_CAPABILITY_FLAG_KEYS: Tuple[Tuple[int, str, str], ...] = (
+    (SUPPORTS_VISION, "supports_vision", "supports_vision"),
+    (SUPPORTS_FUNCTIONS, "supports_function_calling", "supports_functions"),
+    (SUPPORTS_STREAMING, "supports_streaming", "supports_streaming"),
+    (SUPPORTS_STRUCTURED, "supports_structured_output", "supports_structured"),
+    (SUPPORTS_WEB_SEARCH, "supports_web_search", "supports_web_search"),
+    (SUPPORTS_AUDIO, "supports_audio", "supports_audio"),
+    (SUPPORTS_JSON_MODE, "supports_json_mode", "supports_json_mode"),
+)
+
+
+# Parsed documents by content digest, most recently used last
+_PARSE_CACHE_SIZE = 16
+_parsed_yaml_texts: "OrderedDict[bytes, Any]" = OrderedDict()
+_parsed_yaml_texts_lock = threading.Lock()
+
+
+def _parse_yaml_text(content: str) -> Any:
+    """Parse YAML text, memoising the parse for identical content.
+
+    Entries are keyed by a digest of the text, so the cache does not keep the
+    documents themselves alive. Every call returns a private deep copy that
+    the caller is free to modify.
+    """
+    key = hashlib.blake2b(content.encode("utf-8"), digest_size=16).digest()
+    with _parsed_yaml_texts_lock:
+        data = _parsed_yaml_texts.get(key)
+        if data is not None:
+            _parsed_yaml_texts.move_to_end(key)
+    if data is None:
+        data = yaml.load(content, Loader=_YamlLoader)
+        with _parsed_yaml_texts_lock:
+            _parsed_yaml_texts[key] = data
+            while len(_parsed_yaml_texts) > _PARSE_CACHE_SIZE:
+                _parsed_yaml_texts.popitem(last=False)
+    return copy.deepcopy(data)
+
+
+@functools.lru_cache(maxsize=16)
+def _parse_yaml_file(path: str, mtime_ns: int, size: int) -> Any:
+    """Parse a YAML file, memoising the result per ``(path, mtime, size)``.
+
+    The stat fields only form part of the cache key so that edits to the file
+    invalidate the entry. The result is shared; use ``_load_yaml_file``.
+    """
+    # libyaml decodes UTF-8 itself, so hand it the raw bytes
+    with open(path, "rb") as f:
+        return yaml.load(f, Loader=_YamlLoader)
+
+
+def _resolve_plain_scalar(text: str) -> Optional[str]:
+    """Convert a plain YAML scalar to the text of the value a full load builds."""
+    try:
+        value = yaml.load(text, Loader=_YamlLoader)
+    except yaml.YAMLError:
+        return text
+    return None if value is None else str(value)
+
+
+def _scan_top_level_scalar(content: bytes, key: str, complete: bool = True) -> Tuple[bool, Optional[str]]:
+    """Read one top-level scalar from a YAML document without constructing it.
+
+    Walks the parser event stream and stops as soon as ``key`` has been seen,
+    so only the head of the document is tokenised when the key comes first.
+
+    Args:
+        content: Raw YAML document
+        key: Top-level mapping key to look up
+        complete: Whether ``content`` is the whole document. For a leading
+            slice of a document, a value is only accepted once the node after
+            it has started inside the slice, so a value cut short by the end
+            of the slice is never returned.
+
+    Returns:
+        ``(is_mapping, value)``: whether the document root is a mapping, and
+        the scalar value of ``key`` as text (``str()`` of what a full load
+        would construct) or None if it is absent, null or not a scalar
+    """
+    depth = 0
+    at_key = True
+    matched = False
+    events = yaml.parse(content, Loader=_YamlLoader)
+    for event in events:
+        if isinstance(event, (yaml.StreamStartEvent, yaml.DocumentStartEvent)):
+            continue
+        if depth == 0:
+            if not isinstance(event, yaml.MappingStartEvent):
+                return False, None
+            depth = 1
+        elif isinstance(event, (yaml.MappingStartEvent, yaml.SequenceStartEvent)):
+            depth += 1
+        elif isinstance(event, (yaml.MappingEndEvent, yaml.SequenceEndEvent)):
+            depth -= 1
+            if depth == 0:
+                break
+            if depth == 1:
+                # A nested value just closed; the next top-level node is a key
+                at_key = True
+        elif depth == 1:
+            if at_key:
+                matched = isinstance(event, yaml.ScalarEvent) and event.value == key
+                at_key = False
+            else:
+                if matched:
+                    if not isinstance(event, yaml.ScalarEvent):
+                        return True, None
+                    # Plain scalars are typed by the resolver, so e.g. ``1.10``
+                    # reads as ``1.1`` just as in a full load
+                    plain = not event.style and event.implicit[0]
+                    value = _resolve_plain_scalar(event.value) if plain else event.value
+                    if not complete:
+                        try:
+                            following = next(events, None)
+                        except yaml.YAMLError:
+                            following = None
+                        if following is None or following.start_mark.index >= len(content):
+                            return True, None
+                    return True, value
+                at_key = True
+    return True, None
+
+
+def _load_yaml_file(path: str) -> Any:
+    """Parse a YAML file through the stat-keyed parse cache.
+
+    Returns a private deep copy that the caller is free to modify.
+    """
+    st = os.stat(path)
+    return copy.deepcopy(_parse_yaml_file(path, st.st_mtime_ns, st.st_size))
+
+
+# Constraint classes by the ``type`` field used in the constraints file
+_CONSTRAINT_TYPES: Dict[str, Type[Union[NumericConstraint, EnumConstraint, ObjectConstraint]]] = {
+    "numeric": NumericConstraint,
+    "enum": EnumConstraint,
+    "object": ObjectConstraint,
+}
+
+
+def _write_bytes_atomic(path: Union[str, "os.PathLike[str]"], data: bytes) -> None:
+    """Write bytes to a file so readers never observe a partial write.
+
+    The data is written and fsynced to a sibling ``.tmp`` file that then
+    replaces the target with ``os.replace``.
+
+    Args:
+        path: Destination file path
+        data: Bytes to write
+    """
+    tmp_path = f"{os.fspath(path)}.tmp"
+    try:
+        with open(tmp_path, "wb") as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+def _write_bytes_if_changed(path: Union[str, "os.PathLike[str]"], data: bytes) -> bool:
+    """Atomically write bytes unless the file already holds exactly that content.
+
+    Leaving an identical file alone keeps its mtime, so stat-keyed parse
+    caches stay valid across no-op updates.
+
+    Args:
+        path: Destination file path
+        data: Bytes to write
+
+    Returns:
+        True if the file was written, False if it was already up to date
+    """
+    try:
+        if os.stat(path).st_size == len(data):
+            with open(path, "rb") as f:
+                if f.read() == data:
+                    return False
+    except OSError:
+        pass
+    _write_bytes_atomic(path, data)
+    return True
+
+
+def _write_text_atomic(path: Union[str, "os.PathLike[str]"], content: str) -> None:
+    """Write UTF-8 text to a file atomically, see ``_write_bytes_atomic``."""
+    _write_bytes_atomic(path, content.encode("utf-8"))
+
+
+def _parse_date(val: Any) -> Optional[date]:
+    """Parse an ISO date from the registry data, returning None when absent or invalid."""
+    if val in (None, "", "null"):
+        return None
+    try:
+        return datetime.fromisoformat(str(val)).date()
+    except Exception:
+        return None
+
 
 class RegistryConfig:
     """Configuration for the model registry."""
@@ -61,6 +328,7 @@ class RegistryConfig:
         constraints_path: Optional[str] = None,
         auto_update: bool = False,
         cache_size: int = 100,
+        refresh_ttl: int = 0,
     ):
         """Initialize registry configuration.
 
@@ -70,7 +338,17 @@ class RegistryConfig:
             constraints_path: Custom path to constraints YAML file. If None,
                               default location is used.
             auto_update: Whether to automatically update the registry.
-            cache_size: Size of model capabilities cache.
+            cache_size: Maximum number of derived lookups (dated variants
+                        resolved through their base model) kept by
+                        ``get_capabilities``. Registered model names are
+                        always cached and do not count toward the limit.
+            refresh_ttl: Seconds after a remote URL was last confirmed
+                         current (or applied) during which update checks and
+                         non-forced refreshes against the same URL report the
+                         registry as current without contacting the remote.
+                         A check only counts for the data directory and local
+                         models.yaml revision it was made with. 0 disables
+                         the shortcut.
         """
         self.registry_path = registry_path  # Will be handled by DataManager
         self.constraints_path = constraints_path or get_parameter_constraints_path()
@@ -83,6 +361,10 @@ class RegistryConfig:
             raise ValueError("cache_size must not exceed 10000 to prevent excessive memory usage")
         self.cache_size = cache_size
 
+        if refresh_ttl < 0:
+            raise ValueError("refresh_ttl must not be negative")
+        self.refresh_ttl = refresh_ttl
+
 
 class RegistryUpdateStatus(Enum):
     """Status of a registry update operation."""
@@ -165,6 +447,25 @@ class WebSearchBilling:
 class ModelCapabilities:
     """Represents the capabilities of a model."""
 
+    __slots__ = (
+        "model_name",
+        "openai_model_name",
+        "context_window",
+        "max_output_tokens",
+        "deprecation",
+        "flags",
+        "pricing",
+        "input_modalities",
+        "output_modalities",
+        "min_version",
+        "aliases",
+        "_supported_parameters",
+        "_param_by_name",
+        "_constraints",
+        "_inline_parameters",
+        "web_search_billing",
+    )
+
     def __init__(
         self,
         model_name: str,
@@ -188,6 +489,7 @@ class ModelCapabilities:
         constraints: Optional[Dict[str, Union[NumericConstraint, EnumConstraint, ObjectConstraint]]] = None,
         inline_parameters: Optional[Dict[str, Dict[str, Any]]] = None,
         web_search_billing: Optional["WebSearchBilling"] = None,
+        flags: Optional[int] = None,
     ):
         """Initialize model capabilities.
 
@@ -214,29 +516,91 @@ class ModelCapabilities:
             constraints: Dictionary of constraints for validation
             inline_parameters: Dictionary of inline parameter configurations from schema
             web_search_billing: Optional web-search billing policy and rates for the model
+            flags: Capability bits already packed from the ``SUPPORTS_*``
+                constants; when given, the ``supports_*`` arguments are ignored
         """
         self.model_name = model_name
         self.openai_model_name = openai_model_name
         self.context_window = context_window
         self.max_output_tokens = max_output_tokens
         self.deprecation = deprecation
-        self.supports_vision = supports_vision
-        self.supports_functions = supports_functions
-        self.supports_streaming = supports_streaming
-        self.supports_structured = supports_structured
-        self.supports_web_search = supports_web_search
-        self.supports_audio = supports_audio
-        self.supports_json_mode = supports_json_mode
+        if flags is None:
+            flags = (
+                (SUPPORTS_VISION if supports_vision else 0)
+                | (SUPPORTS_FUNCTIONS if supports_functions else 0)
+                | (SUPPORTS_STREAMING if supports_streaming else 0)
+                | (SUPPORTS_STRUCTURED if supports_structured else 0)
+                | (SUPPORTS_WEB_SEARCH if supports_web_search else 0)
+                | (SUPPORTS_AUDIO if supports_audio else 0)
+                | (SUPPORTS_JSON_MODE if supports_json_mode else 0)
+            )
+        self.flags = flags
         self.pricing = pricing
         self.input_modalities = input_modalities or []
         self.output_modalities = output_modalities or []
         self.min_version = min_version
         self.aliases = aliases or []
         self.supported_parameters = supported_parameters or []
-        self._constraints = constraints or {}
+        self._constraints = constraints if constraints is not None else {}
         self._inline_parameters = inline_parameters or {}
         self.web_search_billing = web_search_billing
 
+    @property
+    def supports_vision(self) -> bool:
+        """Whether the model supports vision inputs."""
+        return bool(self.flags & SUPPORTS_VISION)
+
+    @property
+    def supports_functions(self) -> bool:
+        """Whether the model supports function calling."""
+        return bool(self.flags & SUPPORTS_FUNCTIONS)
+
+    @property
+    def supports_streaming(self) -> bool:
+        """Whether the model supports streaming."""
+        return bool(self.flags & SUPPORTS_STREAMING)
+
+    @property
+    def supports_structured(self) -> bool:
+        """Whether the model supports structured output."""
+        return bool(self.flags & SUPPORTS_STRUCTURED)
+
+    @property
+    def supports_web_search(self) -> bool:
+        """Whether the model supports web search."""
+        return bool(self.flags & SUPPORTS_WEB_SEARCH)
+
+    @property
+    def supports_audio(self) -> bool:
+        """Whether the model supports audio inputs."""
+        return bool(self.flags & SUPPORTS_AUDIO)
+
+    @property
+    def supports_json_mode(self) -> bool:
+        """Whether the model supports JSON mode."""
+        return bool(self.flags & SUPPORTS_JSON_MODE)
+
+    @property
+    def supported_parameters(self) -> List[ParameterReference]:
+        """Parameter references supported by this model."""
+        return self._supported_parameters
+
+    @supported_parameters.setter
+    def supported_parameters(self, value: List[ParameterReference]) -> None:
+        """Replace the supported parameters and rebuild the name lookup.
+
+        The list is indexed on assignment; mutating it in place afterwards is
+        not reflected in parameter validation.
+        """
+        self._supported_parameters = value
+        # Index by full reference and by the short name after the last dot.
+        # setdefault keeps the first matching reference, as a linear scan would.
+        param_by_name: Dict[str, ParameterReference] = {}
+        for param in value:
+            param_by_name.setdefault(param.ref, param)
+            param_by_name.setdefault(param.short_name, param)
+        self._param_by_name = param_by_name
+
     @property
     def inline_parameters(self) -> Dict[str, Any]:
         """Inline parameter definitions for this model (if any)."""
@@ -252,6 +616,24 @@ class ModelCapabilities:
         """Check if the model is deprecated or sunset."""
         return self.deprecation.status in ["deprecated", "sunset"]
 
+    def with_openai_name(self, openai_model_name: str) -> "ModelCapabilities":
+        """Create a copy of these capabilities under a different OpenAI model name.
+
+        Used for dated variants that resolve to a registered model. Every other
+        attribute, including the parameter index, is shared with this instance.
+
+        Args:
+            openai_model_name: The model name to use with the OpenAI API
+
+        Returns:
+            A new ModelCapabilities instance
+        """
+        variant = object.__new__(ModelCapabilities)
+        for attr in ModelCapabilities.__slots__:
+            setattr(variant, attr, getattr(self, attr))
+        variant.openai_model_name = openai_model_name
+        return variant
+
     def get_constraint(self, ref: str) -> Optional[Union[NumericConstraint, EnumConstraint, ObjectConstraint]]:
         """Get a constraint by reference.
 
@@ -286,10 +668,7 @@ class ModelCapabilities:
             return
 
         # Find matching parameter reference
-        param_ref = next(
-            (p for p in self.supported_parameters if p.ref == name or p.ref.split(".")[-1] == name),
-            None,
-        )
+        param_ref = self._param_by_name.get(name)
 
         if not param_ref:
             # If we're validating a parameter explicitly, it should be supported
@@ -308,16 +687,8 @@ class ModelCapabilities:
                 ref=param_ref.ref,
             )
 
-        # Validate based on constraint type
-        if isinstance(constraint, NumericConstraint):
-            constraint.validate(name=name, value=value)
-        elif isinstance(constraint, EnumConstraint):
-            constraint.validate(name=name, value=value)
-        elif isinstance(constraint, ObjectConstraint):
-            constraint.validate(name=name, value=value)
-        else:
-            # This shouldn't happen with proper type checking, but just in case
-            raise TypeError(f"Unknown constraint type for '{name}': {type(constraint).__name__}")
+        # Every constraint type implements validate() with the same signature
+        constraint.validate(name=name, value=value)
 
     def validate_parameters(self, params: Dict[str, Any], used_params: Optional[Set[str]] = None) -> None:
         """Validate multiple parameters against constraints.
@@ -329,8 +700,26 @@ class ModelCapabilities:
         Raises:
             ModelRegistryError: If validation fails for any parameter
         """
+        inline_parameters = self._inline_parameters
+        param_by_name = self._param_by_name
+        constraints = self._constraints
         for name, value in params.items():
-            self.validate_parameter(name, value, used_params)
+            if used_params is not None:
+                used_params.add(name)
+
+            # Inline definitions take precedence, as in validate_parameter
+            if name in inline_parameters:
+                self._validate_inline_parameter(name, value)
+                continue
+
+            param_ref = param_by_name.get(name)
+            constraint = constraints.get(param_ref.ref) if param_ref is not None else None
+            if constraint is None:
+                # Error reporting goes through the general path
+                self.validate_parameter(name, value)
+                continue
+
+            constraint.validate(name=name, value=value)
 
     def _validate_inline_parameter(self, name: str, value: Any) -> None:
         """Validate a parameter using inline parameter constraints.
@@ -342,8 +731,6 @@ class ModelCapabilities:
         Raises:
             ValidationError: If validation fails
         """
-        from .errors import ParameterValidationError
-
         param_config = self._inline_parameters[name]
         param_type = param_config.get("type")
 
@@ -467,10 +854,34 @@ class ModelRegistry:
     """Registry for model capabilities and validation."""
 
     _default_instance: Optional["ModelRegistry"] = None
-    # Pre-compile regex patterns for improved performance
-    _DATE_PATTERN = re.compile(r"^(.*)-(\d{4}-\d{2}-\d{2})$")
-    _IS_DATED_MODEL_PATTERN = re.compile(r".*-\d{4}-\d{2}-\d{2}$")
     _instance_lock = threading.RLock()
+    # Shared HTTP session for registry downloads, created on first use
+    _http_session: Optional["requests.Session"] = None
+
+    @staticmethod
+    def _split_dated(name: str) -> Optional[Tuple[str, str]]:
+        """Split a dated model name into its base name and date string.
+
+        Checks for a fixed ``-YYYY-MM-DD`` suffix by position instead of
+        running a regex, since this sits on every lookup miss.
+
+        Args:
+            name: Model name (e.g. "gpt-4o-2024-08-06")
+
+        Returns:
+            ``(base_name, "YYYY-MM-DD")``, or None if the name is not dated
+        """
+        if (
+            len(name) >= 11
+            and name[-11] == "-"
+            and name[-6] == "-"
+            and name[-3] == "-"
+            and name[-10:-6].isdecimal()
+            and name[-5:-3].isdecimal()
+            and name[-2:].isdecimal()
+        ):
+            return name[:-11], name[-10:]
+        return None
 
     @classmethod
     def get_instance(cls) -> "ModelRegistry":
@@ -491,6 +902,11 @@ class ModelRegistry:
         Returns:
             The default ModelRegistry instance
         """
+        # Fast path: once constructed, the instance is returned without locking
+        instance = cls._default_instance
+        if instance is not None:
+            return instance
+
         with cls._instance_lock:
             if cls._default_instance is None:
                 cls._default_instance = cls()
@@ -507,14 +923,39 @@ class ModelRegistry:
         self._capabilities: Dict[str, ModelCapabilities] = {}
         self._constraints: Dict[str, Union[NumericConstraint, EnumConstraint, ObjectConstraint]] = {}
         self._capabilities_lock = threading.RLock()
+        # Read-only live view handed out by the ``models`` property
+        self._models_view: Mapping[str, ModelCapabilities] = MappingProxyType(self._capabilities)
+        # Lookup indexes derived from _capabilities, rebuilt by _build_indexes()
+        self._context_windows: List[int] = []
+        self._output_tokens_by_context: Tuple[int, ...] = ()
+        self._names_by_context: Tuple[str, ...] = ()
+        self._flags_by_context: Tuple[int, ...] = ()
+        # Models keyed by every prefix ending before a '-' in their name, so a
+        # dated lookup can find all "<base>-..." entries without a scan
+        self._models_by_prefix: Dict[str, List[Tuple[str, ModelCapabilities]]] = {}
+        # Per prefix: the entry a dated lookup resolves to, and the highest
+        # min_version in the bucket (requests below it are too old)
+        self._best_by_prefix: Dict[str, Tuple[ModelCapabilities, Optional[ModelVersion]]] = {}
+        self._base_names: FrozenSet[str] = frozenset()
+        self._sorted_base_names: Tuple[str, ...] = ()
         # Stats for last load/dump operations (for observability)
         self._last_load_stats: Dict[str, Any] = {}
+        # ETag/Last-Modified of the last remote config fetched by refresh_from_remote
+        self._remote_validators: Dict[str, str] = {}
+        # Conditional headers parsed from the metadata file, keyed by its (mtime_ns, size)
+        self._meta_cache: Optional[Tuple[Tuple[int, int], Dict[str, str]]] = None
 
         # Initialize DataManager for model and overrides data
         self._data_manager = DataManager()
 
-        # Set up caching for get_capabilities
-        self.get_capabilities = functools.lru_cache(maxsize=self.config.cache_size)(self._get_capabilities_impl)
+        # Cache of resolved get_capabilities lookups. It is seeded with every
+        # registered name; derived (dated) lookups are bounded by
+        # config.cache_size and tracked oldest-first for eviction.
+        self._caps_cache: Dict[str, ModelCapabilities] = {}
+        self._derived_cache_keys: Deque[str] = deque()
+        # Bumped on every cache reset, so a lookup computed against data that
+        # has since been reloaded is not cached
+        self._caps_generation = 0
 
         # Auto-copy default constraint files to user directory if they don't exist
         if not config or not config.constraints_path:
@@ -536,8 +977,7 @@ class ModelRegistry:
                         LogEvent.MODEL_REGISTRY,
                         "Auto-update completed successfully",
                     )
-                    # Reload capabilities after successful auto-update
-                    self._load_capabilities()
+                    # Capabilities are loaded from the updated data below
             except Exception as e:
                 log_warning(
                     LogEvent.MODEL_REGISTRY,
@@ -597,7 +1037,7 @@ class ModelRegistry:
                     # If our heuristic check fails, continue with normal parsing
                     pass
 
-            data = yaml.safe_load(content)
+            data = _parse_yaml_text(content)
 
             # Additional validation after YAML parsing
             if data is None:
@@ -612,21 +1052,7 @@ class ModelRegistry:
                 log_error(LogEvent.MODEL_REGISTRY, error_msg, path="models.yaml")
                 return ConfigResult(success=False, error=error_msg, path="models.yaml")
 
-            # Load and apply provider overrides
-            try:
-                overrides_data = self._load_overrides()
-                if overrides_data:
-                    data = self._apply_overrides(data, overrides_data)
-            except Exception as e:
-                log_warning(
-                    LogEvent.MODEL_REGISTRY,
-                    f"Failed to load or apply overrides: {e}",
-                    error=str(e),
-                )
-
-            # Schema version is declared inside the YAML itself; the loader
-            # supports schema v1.x with top-level ``models`` mapping.
-            return ConfigResult(success=True, data=data, path="models.yaml")
+            return self._config_with_overrides(data)
         except yaml.YAMLError as e:
             error_msg = f"YAML parsing error in models.yaml: {e}"
             log_error(LogEvent.MODEL_REGISTRY, error_msg, path="models.yaml")
@@ -646,6 +1072,31 @@ class ModelRegistry:
                 path="models.yaml",
             )
 
+    def _config_with_overrides(self, data: Dict[str, Any]) -> ConfigResult:
+        """Apply provider overrides to parsed models data.
+
+        Args:
+            data: Parsed models.yaml mapping
+
+        Returns:
+            ConfigResult: The effective configuration
+        """
+        # Load and apply provider overrides
+        try:
+            overrides_data = self._load_overrides()
+            if overrides_data:
+                data = self._apply_overrides(data, overrides_data)
+        except Exception as e:
+            log_warning(
+                LogEvent.MODEL_REGISTRY,
+                f"Failed to load or apply overrides: {e}",
+                error=str(e),
+            )
+
+        # Schema version is declared inside the YAML itself; the loader
+        # supports schema v1.x with top-level ``models`` mapping.
+        return ConfigResult(success=True, data=data, path="models.yaml")
+
     def _load_overrides(self) -> Optional[Dict[str, Any]]:
         """Load provider overrides from overrides.yaml.
 
@@ -668,7 +1119,7 @@ class ModelRegistry:
                 )
                 return None
 
-            data = yaml.safe_load(content)
+            data = _parse_yaml_text(content)
             if not isinstance(data, dict):
                 log_warning(
                     LogEvent.MODEL_REGISTRY,
@@ -737,10 +1188,8 @@ class ModelRegistry:
             )
             return base_data
 
-        # Deep copy base data to avoid modifying original
-        import copy
-
-        result_data = copy.deepcopy(base_data)
+        # The parse cache hands out private copies, so merge in place
+        result_data = base_data
 
         # Apply model-specific overrides
         for model_name, override_config in provider_overrides["models"].items():
@@ -779,159 +1228,53 @@ class ModelRegistry:
     def _load_constraints(self) -> None:
         """Load parameter constraints from file."""
         try:
-            with open(self.config.constraints_path, "r") as f:
-                data = yaml.safe_load(f)
-                if not isinstance(data, dict):
-                    log_error(
-                        LogEvent.MODEL_REGISTRY,
-                        "Constraints file must contain a dictionary",
-                    )
-                    return
-
-                # Handle nested structure: numeric_constraints and enum_constraints
-                for category_name, category_data in data.items():
-                    if not isinstance(category_data, dict):
-                        log_error(
-                            LogEvent.MODEL_REGISTRY,
-                            f"Constraint category '{category_name}' must be a dictionary",
-                            category=category_data,
-                        )
-                        continue
-
-                    # Process each constraint in the category
-                    for constraint_name, constraint in category_data.items():
-                        if not isinstance(constraint, dict):
-                            log_error(
-                                LogEvent.MODEL_REGISTRY,
-                                f"Constraint '{constraint_name}' must be a dictionary",
-                                constraint=constraint,
-                            )
-                            continue
-
-                        constraint_type = constraint.get("type", "")
-                        if not constraint_type:
-                            log_error(
-                                LogEvent.MODEL_REGISTRY,
-                                f"Constraint '{constraint_name}' missing required 'type' field",
-                                constraint=constraint,
-                            )
-                            continue
-
-                        # Create full reference name (e.g., "numeric_constraints.temperature")
-                        full_ref = f"{category_name}.{constraint_name}"
-
-                        if constraint_type == "numeric":
-                            min_value = constraint.get("min_value")
-                            max_value = constraint.get("max_value")
-                            allow_float = constraint.get("allow_float", True)
-                            allow_int = constraint.get("allow_int", True)
-                            description = constraint.get("description", "")
-
-                            # Type validation
-                            if min_value is not None and not isinstance(min_value, (int, float)):
-                                log_error(
-                                    LogEvent.MODEL_REGISTRY,
-                                    f"Constraint '{constraint_name}' has non-numeric 'min_value' value",
-                                    min_value=min_value,
-                                )
-                                continue
-
-                            if max_value is not None and not isinstance(max_value, (int, float)):
-                                log_error(
-                                    LogEvent.MODEL_REGISTRY,
-                                    f"Constraint '{constraint_name}' has non-numeric 'max_value' value",
-                                    max_value=max_value,
-                                )
-                                continue
+            data = _load_yaml_file(self.config.constraints_path)
+            if not isinstance(data, dict):
+                log_error(
+                    LogEvent.MODEL_REGISTRY,
+                    "Constraints file must contain a dictionary",
+                )
+                return
 
-                            if not isinstance(allow_float, bool) or not isinstance(allow_int, bool):
-                                log_error(
-                                    LogEvent.MODEL_REGISTRY,
-                                    f"Constraint '{constraint_name}' has non-boolean 'allow_float' or 'allow_int'",
-                                    allow_float=allow_float,
-                                    allow_int=allow_int,
-                                )
-                                continue
-
-                            # Create constraint
-                            self._constraints[full_ref] = NumericConstraint(
-                                min_value=min_value if min_value is not None else 0.0,
-                                max_value=max_value,
-                                allow_float=allow_float,
-                                allow_int=allow_int,
-                                description=description,
-                            )
-                        elif constraint_type == "enum":
-                            allowed_values = constraint.get("allowed_values")
-                            description = constraint.get("description", "")
+            # Invalid entries are skipped and reported together below
+            errors: List[str] = []
 
-                            # Required field validation
-                            if allowed_values is None:
-                                log_error(
-                                    LogEvent.MODEL_REGISTRY,
-                                    f"Constraint '{constraint_name}' missing required 'allowed_values' field",
-                                    constraint=constraint,
-                                )
-                                continue
+            # Handle nested structure: numeric_constraints and enum_constraints
+            for category_name, category_data in data.items():
+                if not isinstance(category_data, dict):
+                    errors.append(f"Constraint category '{category_name}' must be a dictionary")
+                    continue
 
-                            # Type validation
-                            if not isinstance(allowed_values, list):
-                                log_error(
-                                    LogEvent.MODEL_REGISTRY,
-                                    f"Constraint '{constraint_name}' has non-list 'allowed_values' field",
-                                    allowed_values=allowed_values,
-                                )
-                                continue
+                # Process each constraint in the category
+                for constraint_name, constraint in category_data.items():
+                    if not isinstance(constraint, dict):
+                        errors.append(f"Constraint '{constraint_name}' must be a dictionary")
+                        continue
 
-                            # Validate all values are strings
-                            if not all(isinstance(val, str) for val in allowed_values):
-                                log_error(
-                                    LogEvent.MODEL_REGISTRY,
-                                    f"Constraint '{constraint_name}' has non-string values in 'allowed_values' list",
-                                    allowed_values=allowed_values,
-                                )
-                                continue
+                    constraint_type = constraint.get("type", "")
+                    if not constraint_type:
+                        errors.append(f"Constraint '{constraint_name}' missing required 'type' field")
+                        continue
 
-                            # Create constraint
-                            self._constraints[full_ref] = EnumConstraint(
-                                allowed_values=allowed_values,
-                                description=description,
-                            )
-                        elif constraint_type == "object":
-                            # Implementation for object constraint type
-                            description = constraint.get("description", "")
-                            required_keys = constraint.get("required_keys", [])
-                            allowed_keys = constraint.get("allowed_keys")
-
-                            # Type validation
-                            if not isinstance(required_keys, list):
-                                log_error(
-                                    LogEvent.MODEL_REGISTRY,
-                                    f"Constraint '{constraint_name}' has non-list 'required_keys' field",
-                                    required_keys=required_keys,
-                                )
-                                continue
+                    constraint_cls = _CONSTRAINT_TYPES.get(constraint_type)
+                    if constraint_cls is None:
+                        errors.append(f"Unknown constraint type '{constraint_type}' for '{constraint_name}'")
+                        continue
 
-                            if allowed_keys is not None and not isinstance(allowed_keys, list):
-                                log_error(
-                                    LogEvent.MODEL_REGISTRY,
-                                    f"Constraint '{constraint_name}' has non-list 'allowed_keys' field",
-                                    allowed_keys=allowed_keys,
-                                )
-                                continue
+                    # Full reference name (e.g., "numeric_constraints.temperature")
+                    full_ref = sys.intern(f"{category_name}.{constraint_name}")
+                    try:
+                        self._constraints[full_ref] = constraint_cls.from_mapping(constraint)
+                    except ValueError as e:
+                        errors.append(f"Constraint '{constraint_name}' {e}")
 
-                            # Create constraint
-                            self._constraints[full_ref] = ObjectConstraint(
-                                description=description,
-                                required_keys=required_keys,
-                                allowed_keys=allowed_keys,
-                            )
-                        else:
-                            log_error(
-                                LogEvent.MODEL_REGISTRY,
-                                f"Unknown constraint type '{constraint_type}' for '{constraint_name}'",
-                                constraint=constraint,
-                            )
+            if errors:
+                log_error(
+                    LogEvent.MODEL_REGISTRY,
+                    "Skipped invalid parameter constraints",
+                    path=self.config.constraints_path,
+                    errors=errors,
+                )
 
         except FileNotFoundError:
             log_warning(
@@ -947,9 +1290,15 @@ class ModelRegistry:
                 error=str(e),
             )
 
-    def _load_capabilities(self) -> None:
-        """Load model capabilities from config."""
-        config_result = self._load_config()
+    def _load_capabilities(self, config_result: Optional[ConfigResult] = None) -> None:
+        """Load model capabilities from config.
+
+        Args:
+            config_result: Already loaded configuration to use instead of
+                reading models.yaml again
+        """
+        if config_result is None:
+            config_result = self._load_config()
         # Abort if configuration failed to load
         if not config_result.success or config_result.data is None:
             log_error(
@@ -1033,14 +1382,27 @@ class ModelRegistry:
         the ``ModelCapabilities`` dataclass so the public API remains
         unchanged.
         """
-        from datetime import date, datetime
-
         loaded_count: int = 0
         skipped_count: int = 0
         first_error: Optional[str] = None
+        loaded: Dict[str, ModelCapabilities] = {}
+
+        # Most models accept the same parameters; share one reference object
+        # per parameter name instead of allocating one per model
+        param_ref_cache: Dict[str, ParameterReference] = {}
+
+        def shared_param_ref(param_name: str) -> ParameterReference:
+            param_ref = param_ref_cache.get(param_name)
+            if param_ref is None:
+                param_ref = ParameterReference(ref=sys.intern(param_name), description=f"Parameter {param_name}")
+                param_ref_cache[param_name] = param_ref
+            return param_ref
 
         for model_name, model_config in models_data.items():
             try:
+                # Interned names let lookups with interned keys match by identity
+                model_name = sys.intern(model_name)
+
                 # -------------------
                 # Context window size
                 # -------------------
@@ -1058,48 +1420,10 @@ class ModelRegistry:
                 # -------------
                 caps_block: Dict[str, Any] = model_config.get("capabilities", {})
 
-                supports_vision = bool(
-                    caps_block.get(
-                        "supports_vision",
-                        model_config.get("supports_vision", False),
-                    )
-                )
-                supports_functions = bool(
-                    caps_block.get(
-                        "supports_function_calling",
-                        model_config.get("supports_functions", False),
-                    )
-                )
-                supports_streaming = bool(
-                    caps_block.get(
-                        "supports_streaming",
-                        model_config.get("supports_streaming", False),
-                    )
-                )
-                supports_structured = bool(
-                    caps_block.get(
-                        "supports_structured_output",
-                        model_config.get("supports_structured", False),
-                    )
-                )
-                supports_web_search = bool(
-                    caps_block.get(
-                        "supports_web_search",
-                        model_config.get("supports_web_search", False),
-                    )
-                )
-                supports_audio = bool(
-                    caps_block.get(
-                        "supports_audio",
-                        model_config.get("supports_audio", False),
-                    )
-                )
-                supports_json_mode = bool(
-                    caps_block.get(
-                        "supports_json_mode",
-                        model_config.get("supports_json_mode", False),
-                    )
-                )
+                flags = 0
+                for flag, caps_key, legacy_key in _CAPABILITY_FLAG_KEYS:
+                    if caps_block.get(caps_key, model_config.get(legacy_key, False)):
+                        flags |= flag
 
                 # -------------
                 # Deprecation
@@ -1107,14 +1431,6 @@ class ModelRegistry:
                 dep_block: Dict[str, Any] = model_config.get("deprecation", {})
                 dep_status = dep_block.get("status", "active")
 
-                def _parse_date(val: Any) -> Optional[date]:
-                    if val in (None, "", "null"):
-                        return None
-                    try:
-                        return datetime.fromisoformat(str(val)).date()
-                    except Exception:
-                        return None
-
                 deprecates_on = _parse_date(dep_block.get("deprecates_on"))
                 sunsets_on = _parse_date(dep_block.get("sunsets_on")) or _parse_date(dep_block.get("sunset_date"))
 
@@ -1156,18 +1472,12 @@ class ModelRegistry:
                 if parameters_block and isinstance(parameters_block, dict):
                     for param_name, param_config in parameters_block.items():
                         if isinstance(param_config, dict):
-                            # Create parameter reference
-                            param_refs.append(
-                                ParameterReference(
-                                    ref=param_name,
-                                    description=f"Parameter {param_name}",
-                                )
-                            )
+                            param_refs.append(shared_param_ref(param_name))
                     # If we collected inline parameters but there were no explicit supported_parameters,
                     # use the inline list as supported parameters to allow validation.
                     if not param_refs:
                         for param_name in parameters_block.keys():
-                            param_refs.append(ParameterReference(ref=param_name, description=f"Parameter {param_name}"))
+                            param_refs.append(shared_param_ref(param_name))
 
                 # Note: legacy 'supported_parameters' is intentionally not supported.
 
@@ -1253,26 +1563,19 @@ class ModelRegistry:
                     context_window=context_window,
                     max_output_tokens=max_output_tokens,
                     deprecation=deprecation,
-                    supports_vision=supports_vision,
-                    supports_functions=supports_functions,
-                    supports_streaming=supports_streaming,
-                    supports_structured=supports_structured,
-                    supports_web_search=supports_web_search,
-                    supports_audio=supports_audio,
-                    supports_json_mode=supports_json_mode,
+                    flags=flags,
                     pricing=pricing_obj,
                     input_modalities=model_config.get("input_modalities"),
                     output_modalities=model_config.get("output_modalities"),
                     min_version=min_version,
                     aliases=[],
                     supported_parameters=param_refs,
-                    constraints=copy.deepcopy(self._constraints),
+                    constraints=self._constraints,
                     inline_parameters=parameters_block,
                     web_search_billing=web_search_billing,
                 )
 
-                with self._capabilities_lock:
-                    self._capabilities[model_name] = capabilities
+                loaded[model_name] = capabilities
                 loaded_count += 1
             except Exception as e:  # pragma: no cover – best-effort parsing
                 if first_error is None:
@@ -1285,6 +1588,12 @@ class ModelRegistry:
                     error=str(e),
                 )
 
+        # Publish the whole batch as a new mapping under a single lock
+        # acquisition, so views handed out by ``models`` never change size
+        # while a caller iterates them
+        with self._capabilities_lock:
+            self._capabilities = {**self._capabilities, **loaded}
+
         # Bookkeep and log summary for observability
         try:
             self._last_load_stats = {
@@ -1304,6 +1613,140 @@ class ModelRegistry:
             skipped=skipped_count,
         )
 
+        self._build_indexes()
+
+    def _build_indexes(self) -> None:
+        """Rebuild the lookup indexes derived from the loaded capabilities.
+
+        Called after every (re)load so that bulk queries can run against
+        precomputed, sorted columns instead of walking every capabilities object.
+        """
+        with self._capabilities_lock:
+            self._models_view = MappingProxyType(self._capabilities)
+            by_context = sorted(self._capabilities.items(), key=lambda item: item[1].context_window)
+            self._context_windows = [caps.context_window for _, caps in by_context]
+            self._output_tokens_by_context = tuple(caps.max_output_tokens for _, caps in by_context)
+            self._names_by_context = tuple(name for name, _ in by_context)
+            self._flags_by_context = tuple(caps.flags for _, caps in by_context)
+
+            models_by_prefix: Dict[str, List[Tuple[str, ModelCapabilities]]] = {}
+            for name, caps in self._capabilities.items():
+                dash = name.find("-")
+                while dash != -1:
+                    models_by_prefix.setdefault(name[:dash], []).append((name, caps))
+                    dash = name.find("-", dash + 1)
+            self._models_by_prefix = models_by_prefix
+            best_by_prefix: Dict[str, Tuple[ModelCapabilities, Optional[ModelVersion]]] = {}
+            for prefix, versions in models_by_prefix.items():
+                # The entry with the highest min_version wins (first one on
+                # ties); the first entry is the fallback when none declares one
+                best_caps = versions[0][1]
+                best_min_version = best_caps.min_version
+                for _name, caps in versions[1:]:
+                    min_version = caps.min_version
+                    if min_version is not None and (best_min_version is None or min_version > best_min_version):
+                        best_caps = caps
+                        best_min_version = min_version
+                best_by_prefix[prefix] = (best_caps, best_min_version)
+            self._best_by_prefix = best_by_prefix
+            self._base_names = frozenset(name for name in self._capabilities if not self._split_dated(name))
+            self._sorted_base_names = tuple(sorted(self._base_names))
+            # Cached lookups may reference capabilities from the previous load
+            self._clear_capabilities_cache()
+
+    def filter_by_context(self, min_context_window: int, min_output_tokens: int = 0) -> List[str]:
+        """Find models that satisfy minimum token limits.
+
+        Args:
+            min_context_window: Minimum context window size in tokens
+            min_output_tokens: Minimum number of output tokens (0 disables the check)
+
+        Returns:
+            Names of matching models, ordered by ascending context window
+        """
+        with self._capabilities_lock:
+            start = bisect.bisect_left(self._context_windows, min_context_window)
+            names = self._names_by_context[start:]
+            if min_output_tokens <= 0:
+                return list(names)
+            output_tokens = self._output_tokens_by_context[start:]
+            return [name for name, tokens in zip(names, output_tokens) if tokens >= min_output_tokens]
+
+    def filter_by_flags(self, flags: int) -> List[str]:
+        """Find models that support every capability in a flag mask.
+
+        Args:
+            flags: Bitwise OR of capability flags (e.g. ``SUPPORTS_STREAMING | SUPPORTS_STRUCTURED``)
+
+        Returns:
+            Names of matching models, ordered by ascending context window
+        """
+        with self._capabilities_lock:
+            return [
+                name
+                for name, model_flags in zip(self._names_by_context, self._flags_by_context)
+                if model_flags & flags == flags
+            ]
+
+    def get_capabilities(self, model: str) -> ModelCapabilities:
+        """Get the capabilities for a model.
+
+        Results are cached per model name; the cache is cleared whenever the
+        registry is reloaded.
+
+        Args:
+            model: Model name, which can be:
+                  - Dated model (e.g. "gpt-4o-2024-08-06")
+                  - Alias (e.g. "gpt-4o")
+                  - Versioned model (e.g. "gpt-4o-2024-09-01")
+
+        Returns:
+            ModelCapabilities for the requested model
+
+        Raises:
+            ModelNotSupportedError: If the model is not supported
+            InvalidDateError: If the date components are invalid
+            VersionTooOldError: If the version is older than minimum supported
+        """
+        capabilities = self._caps_cache.get(model)
+        if capabilities is not None:
+            return capabilities
+
+        generation = self._caps_generation
+        capabilities = self._get_capabilities_impl(model)
+        with self._capabilities_lock:
+            if generation != self._caps_generation:
+                # The registry was reloaded while resolving; don't cache stale data
+                return capabilities
+            cache = self._caps_cache
+            if model not in cache:
+                derived = self._derived_cache_keys
+                if len(derived) >= self.config.cache_size:
+                    # Evict the oldest derived entry to keep the cache bounded
+                    cache.pop(derived.popleft(), None)
+                derived.append(model)
+            return cache.setdefault(model, capabilities)
+
+    def cache_clear(self) -> None:
+        """Clear cached ``get_capabilities`` results.
+
+        Takes the place of ``get_capabilities.cache_clear()``, which was
+        available while lookups were wrapped in ``functools.lru_cache``.
+        """
+        self._clear_capabilities_cache()
+
+    def _clear_capabilities_cache(self) -> None:
+        """Reset the get_capabilities cache to the registered models.
+
+        Exact names resolve to the loaded capabilities unchanged, so they are
+        seeded up front and every registered name is served by the fast path.
+        """
+        with self._capabilities_lock:
+            self._caps_cache.clear()
+            self._caps_cache.update(self._capabilities)
+            self._derived_cache_keys.clear()
+            self._caps_generation += 1
+
     def _get_capabilities_impl(self, model: str) -> ModelCapabilities:
         """Implementation of get_capabilities without caching.
 
@@ -1323,47 +1766,35 @@ class ModelRegistry:
         """
         # First check for exact match (dated model or alias)
         with self._capabilities_lock:
-            if model in self._capabilities:
-                return self._capabilities[model]
+            capabilities = self._capabilities.get(model)
+        if capabilities is not None:
+            return capabilities
 
         # Check if this is a versioned model
-        version_match = self._DATE_PATTERN.match(model)
-        if version_match:
-            base_name = version_match.group(1)
-            version_str = version_match.group(2)
+        dated = self._split_dated(model)
+        if dated:
+            base_name, version_str = dated
 
             # Find all capabilities for this base model
             with self._capabilities_lock:
-                model_versions = [(k, v) for k, v in self._capabilities.items() if k.startswith(f"{base_name}-")]
-
-            if not model_versions:
-                # No versions found for this base model
-                # Find aliases that might provide a valid alternative
-                with self._capabilities_lock:
-                    aliases = [
-                        name for name in self._capabilities.keys() if not self._IS_DATED_MODEL_PATTERN.match(name)
-                    ]
-
-                # Find if any alias might match the base model
-                matching_aliases = [alias for alias in aliases if alias == base_name]
-
-                if matching_aliases:
+                model_versions = self._models_by_prefix.get(base_name, [])
+                best = self._best_by_prefix.get(base_name)
+                base_names = self._sorted_base_names
+
+            if not model_versions or best is None:
+                # No versions found for this base model; suggest the matching
+                # base model if there is one
+                if base_name in base_names:
                     raise ModelNotSupportedError(
                         f"Model '{model}' not found.",
                         model=model,
-                        available_models=matching_aliases,
-                    )
-                else:
-                    # No matching aliases either
-                    with self._capabilities_lock:
-                        available_base_models: set[str] = set(
-                            k for k in self._capabilities.keys() if not self._IS_DATED_MODEL_PATTERN.match(k)
-                        )
-                    raise ModelNotSupportedError(
-                        f"Model '{model}' not found. Available base models: {', '.join(sorted(available_base_models))}",
-                        model=model,
-                        available_models=list(available_base_models),
+                        available_models=[base_name],
                     )
+                raise ModelNotSupportedError(
+                    f"Model '{model}' not found. Available base models: {', '.join(base_names)}",
+                    model=model,
+                    available_models=list(base_names),
+                )
 
             try:
                 # Parse version
@@ -1371,59 +1802,30 @@ class ModelRegistry:
             except ValueError as e:
                 raise InvalidDateError(str(e))
 
-            # Find the model with the minimum version
-            for _unused, caps in model_versions:
-                if caps.min_version and requested_version < caps.min_version:
-                    raise VersionTooOldError(
-                        f"Model version '{model}' is older than the minimum supported "
-                        f"version {caps.min_version} for {base_name}.",
-                        model=model,
-                        min_version=str(caps.min_version),
-                        alias=None,
-                    )
+            # The precomputed best entry carries the highest minimum version,
+            # so one comparison decides whether any entry rejects the request
+            base_model_caps, best_min_version = best
+            if best_min_version is not None and requested_version < best_min_version:
+                # Report the first entry that rejects it, as listed in the data
+                for _dated_model, caps in model_versions:
+                    min_version = caps.min_version
+                    if min_version is not None and requested_version < min_version:
+                        raise VersionTooOldError(
+                            f"Model version '{model}' is older than the minimum supported "
+                            f"version {min_version} for {base_name}.",
+                            model=model,
+                            min_version=str(min_version),
+                            alias=None,
+                        )
 
-            # Find the best matching model
-            base_model_caps = None
-            for _dated_model, caps in model_versions:
-                if base_model_caps is None or (
-                    caps.min_version
-                    and caps.min_version <= requested_version
-                    and (not base_model_caps.min_version or caps.min_version > base_model_caps.min_version)
-                ):
-                    base_model_caps = caps
-
-            if base_model_caps:
-                # Create a copy with the requested model name
-                new_caps = ModelCapabilities(
-                    model_name=base_model_caps.model_name,
-                    openai_model_name=model,
-                    context_window=base_model_caps.context_window,
-                    max_output_tokens=base_model_caps.max_output_tokens,
-                    deprecation=base_model_caps.deprecation,
-                    supports_vision=base_model_caps.supports_vision,
-                    supports_functions=base_model_caps.supports_functions,
-                    supports_streaming=base_model_caps.supports_streaming,
-                    supports_structured=base_model_caps.supports_structured,
-                    supports_web_search=base_model_caps.supports_web_search,
-                    supports_audio=base_model_caps.supports_audio,
-                    supports_json_mode=base_model_caps.supports_json_mode,
-                    pricing=base_model_caps.pricing,
-                    input_modalities=base_model_caps.input_modalities,
-                    output_modalities=base_model_caps.output_modalities,
-                    min_version=base_model_caps.min_version,
-                    aliases=base_model_caps.aliases,
-                    supported_parameters=base_model_caps.supported_parameters,
-                    constraints=base_model_caps._constraints,
-                )
-                return new_caps
+            # Same capabilities, reported under the requested model name
+            return base_model_caps.with_openai_name(model)
 
         # If we get here, the model is not supported
         with self._capabilities_lock:
-            available_models: set[str] = set(
-                k for k in self._capabilities.keys() if not self._IS_DATED_MODEL_PATTERN.match(k)
-            )
+            available_models = self._sorted_base_names
         raise ModelNotSupportedError(
-            f"Model '{model}' not found. Available base models: {', '.join(sorted(available_models))}",
+            f"Model '{model}' not found. Available base models: {', '.join(available_models)}",
             model=model,
             available_models=list(available_models),
         )
@@ -1440,12 +1842,13 @@ class ModelRegistry:
         Raises:
             ConstraintNotFoundError: If the constraint is not found
         """
-        if ref not in self._constraints:
+        try:
+            return self._constraints[ref]
+        except KeyError:
             raise ConstraintNotFoundError(
                 f"Constraint reference '{ref}' not found in registry",
                 ref=ref,
-            )
-        return self._constraints[ref]
+            ) from None
 
     def assert_model_active(self, model: str) -> None:
         """Assert that a model is active and warn if deprecated.
@@ -1490,23 +1893,60 @@ class ModelRegistry:
         if force:
             return {}
 
-        headers = {}
         meta_path = self._get_metadata_path()
-        if meta_path and os.path.exists(meta_path):
+        if not meta_path:
+            return {}
+        # A single stat both detects a missing file and stamps the cache entry
+        try:
+            st = os.stat(meta_path)
+        except OSError:
+            return {}
+
+        # Reuse the headers parsed from an unchanged metadata file
+        stamp = (st.st_mtime_ns, st.st_size)
+        cached = self._meta_cache
+        if cached is not None and cached[0] == stamp:
+            return dict(cached[1])
+
+        headers: Dict[str, str] = {}
+        try:
+            with open(meta_path, "rb") as f:
+                raw = f.read()
             try:
-                with open(meta_path, "r") as f:
-                    metadata = yaml.safe_load(f)
-                    if metadata and isinstance(metadata, dict):
-                        if "etag" in metadata:
-                            headers["If-None-Match"] = metadata["etag"]
-                        if "last_modified" in metadata:
-                            headers["If-Modified-Since"] = metadata["last_modified"]
-            except Exception as e:
-                log_debug(
-                    LogEvent.MODEL_REGISTRY,
-                    "Could not load cache metadata, skipping conditional headers",
-                    error=str(e),
-                )
+                metadata = json.loads(raw)
+            except ValueError:
+                # Metadata written by older versions is YAML
+                metadata = yaml.load(raw, Loader=_YamlLoader)
+            if metadata and isinstance(metadata, dict):
+                headers = self._conditional_headers_from(metadata)
+        except FileNotFoundError:
+            # Removed between the stat and the open, e.g. by a concurrent refresh
+            return headers
+        except Exception as e:
+            log_debug(
+                LogEvent.MODEL_REGISTRY,
+                "Could not load cache metadata, skipping conditional headers",
+                error=str(e),
+            )
+            return headers
+        self._meta_cache = (stamp, headers)
+        return dict(headers)
+
+    @staticmethod
+    def _conditional_headers_from(metadata: Mapping[str, Any]) -> Dict[str, str]:
+        """Build conditional request headers from saved cache validators.
+
+        Args:
+            metadata: Cache metadata with optional ``etag``/``last_modified`` keys
+
+        Returns:
+            Dictionary of HTTP headers
+        """
+        headers: Dict[str, str] = {}
+        if "etag" in metadata:
+            headers["If-None-Match"] = metadata["etag"]
+        if "last_modified" in metadata:
+            headers["If-Modified-Since"] = metadata["last_modified"]
         return headers
 
     def _get_metadata_path(self) -> Optional[str]:
@@ -1519,6 +1959,25 @@ class ModelRegistry:
             return None
         return f"{self.config.registry_path}.meta"
 
+    @staticmethod
+    def _response_validators(response: Any) -> Dict[str, str]:
+        """Extract cache validators from an HTTP response.
+
+        Args:
+            response: HTTP response from the data host
+
+        Returns:
+            Dictionary with ``etag`` and/or ``last_modified`` keys
+        """
+        validators: Dict[str, str] = {}
+        etag = response.headers.get("ETag")
+        if isinstance(etag, str):
+            validators["etag"] = etag
+        last_modified = response.headers.get("Last-Modified")
+        if isinstance(last_modified, str):
+            validators["last_modified"] = last_modified
+        return validators
+
     def _save_cache_metadata(self, metadata: Dict[str, str]) -> None:
         """Save cache metadata to file.
 
@@ -1530,8 +1989,11 @@ class ModelRegistry:
             return
 
         try:
-            with open(meta_path, "w") as f:
-                yaml.safe_dump(metadata, f)
+            # JSON, as read by the CLI cache commands
+            _write_text_atomic(meta_path, json.dumps(metadata, separators=(",", ":")))
+            # Prime the header cache so the next check does not re-read the file
+            st = os.stat(meta_path)
+            self._meta_cache = ((st.st_mtime_ns, st.st_size), self._conditional_headers_from(metadata))
         except Exception as e:
             log_warning(
                 LogEvent.MODEL_REGISTRY,
@@ -1540,6 +2002,42 @@ class ModelRegistry:
                 path=str(meta_path),  # Convert to string in case meta_path is None
             )
 
+    @classmethod
+    def _get_session(cls) -> "requests.Session":
+        """Get the shared HTTP session used for registry downloads.
+
+        The session keeps connections to the data host alive between requests
+        and retries transient gateway errors.
+
+        Returns:
+            The shared ``requests.Session``
+        """
+        session = cls._http_session
+        if session is not None:
+            return session
+        with cls._instance_lock:
+            if cls._http_session is None:
+                import requests
+                from requests.adapters import HTTPAdapter
+                from urllib3.util.retry import Retry
+
+                retry = Retry(
+                    total=2,
+                    backoff_factor=0.3,
+                    status_forcelist=[502, 503, 504],
+                    # Hand the final response back so callers see the status code
+                    raise_on_status=False,
+                )
+                session = requests.Session()
+                session.mount(
+                    "https://",
+                    # pool_block=False: an exhausted pool opens a fresh connection
+                    # instead of waiting indefinitely for one to be returned
+                    HTTPAdapter(pool_connections=4, pool_maxsize=10, max_retries=retry, pool_block=False),
+                )
+                cls._http_session = session
+            return cls._http_session
+
     def _fetch_remote_config(self, url: str) -> Optional[Dict[str, Any]]:
         """Fetch the remote configuration from the specified URL.
 
@@ -1559,8 +2057,8 @@ class ModelRegistry:
             return None
 
         try:
-            # Add a timeout of 10 seconds to prevent indefinite hanging
-            response = requests.get(url, timeout=10)
+            # Connect/read timeouts prevent indefinite hanging
+            response = self._get_session().get(url, timeout=_HTTP_TIMEOUT)
             try:
                 if response.status_code != 200:
                     log_error(
@@ -1570,8 +2068,8 @@ class ModelRegistry:
                     )
                     return None
 
-                # Parse the YAML content
-                config = yaml.safe_load(response.text)
+                # Parse the raw body; libyaml decodes UTF-8 itself
+                config = yaml.load(response.content, Loader=_YamlLoader)
                 if not isinstance(config, dict):
                     log_error(
                         LogEvent.MODEL_REGISTRY,
@@ -1580,6 +2078,8 @@ class ModelRegistry:
                     )
                     return None
 
+                # Persisted only once the update is applied, see refresh_from_remote
+                self._remote_validators = self._response_validators(response)
                 return config
             finally:
                 # Ensure response is closed to prevent resource leaks
@@ -1628,11 +2128,16 @@ class ModelRegistry:
         Returns:
             Result of the refresh operation
         """
+        if not force and not validate_only and self._within_refresh_ttl(url):
+            return RefreshResult(
+                success=True,
+                status=RefreshStatus.ALREADY_CURRENT,
+                message="Registry was updated recently; skipping remote check",
+            )
+
         try:
             # Get remote config
-            config_url = url or (
-                "https://raw.githubusercontent.com/yaniv-golan/openai-model-registry/main/data/models.yaml"
-            )
+            config_url = url or _DEFAULT_REGISTRY_URL
             remote_config = self._fetch_remote_config(config_url)
             if not remote_config:
                 raise ValueError("Failed to fetch remote configuration")
@@ -1650,8 +2155,15 @@ class ModelRegistry:
 
             # Check for updates only if not forcing and not validating
             if not force:
-                result = self.check_for_updates(url=url)
+                if self._data_manager.should_update_data():
+                    # Release-based check through the DataManager
+                    result = self.check_for_updates(url=url)
+                else:
+                    # The remote document is already in hand; compare its
+                    # version instead of downloading it a second time
+                    result = self._compare_remote_version(str(remote_config.get("version", "unknown")))
                 if result.status == RefreshStatus.ALREADY_CURRENT:
+                    self._record_remote_check(url)
                     return RefreshResult(
                         success=True,
                         status=RefreshStatus.ALREADY_CURRENT,
@@ -1659,6 +2171,7 @@ class ModelRegistry:
                     )
 
             # Use DataManager to handle the update
+            written_config: Optional[ConfigResult] = None
             try:
                 # Force update through DataManager
                 if self._data_manager.force_update():
@@ -1674,12 +2187,11 @@ class ModelRegistry:
                         "DataManager update failed, using limited fallback (models.yaml only)",
                     )
                     target_path = get_user_data_dir() / "models.yaml"
-                    with open(target_path, "w") as f:
-                        yaml.safe_dump(remote_config, f)
+                    _write_bytes_if_changed(target_path, yaml.dump(remote_config, Dumper=_YamlDumper).encode("utf-8"))
 
                     # Try to download overrides.yaml if possible
                     try:
-                        overrides_url = "https://raw.githubusercontent.com/yaniv-golan/openai-model-registry/main/data/overrides.yaml"
+                        overrides_url = _DEFAULT_OVERRIDES_URL
 
                         # Simple fallback downloads
                         try:
@@ -1690,12 +2202,12 @@ class ModelRegistry:
                         if requests is not None:
                             try:
                                 # Download overrides.yaml
-                                overrides_resp = requests.get(overrides_url, timeout=30)
+                                overrides_resp = self._get_session().get(overrides_url, timeout=_DOWNLOAD_TIMEOUT)
                                 if overrides_resp.status_code == 200:
-                                    overrides_content = overrides_resp.text
+                                    # Store the body as received, without a decode/encode round trip
+                                    overrides_content = overrides_resp.content
                                     overrides_path = get_user_data_dir() / "overrides.yaml"
-                                    with open(overrides_path, "w") as f:
-                                        f.write(overrides_content)
+                                    _write_bytes_if_changed(overrides_path, overrides_content)
                                     log_info(
                                         LogEvent.MODEL_REGISTRY,
                                         "Downloaded overrides.yaml in fallback",
@@ -1711,6 +2223,14 @@ class ModelRegistry:
                             LogEvent.MODEL_REGISTRY,
                             f"Error in fallback additional file download: {e}",
                         )
+
+                    # The document just written is already parsed and validated;
+                    # reuse it when it is the file the registry loads from
+                    if (
+                        not os.getenv("OMR_MODEL_REGISTRY_PATH")
+                        and self._data_manager.get_data_file_path("models.yaml") == target_path
+                    ):
+                        written_config = self._config_with_overrides(remote_config)
             except PermissionError as e:
                 log_error(
                     LogEvent.MODEL_REGISTRY,
@@ -1736,9 +2256,9 @@ class ModelRegistry:
                     message=f"Error writing to {target_path}: {str(e)}",
                 )
 
-            # Reload the registry with new configuration
-            self._load_constraints()
-            self._load_capabilities()
+            # Reload the registry with new configuration. A refresh only rewrites
+            # models.yaml/overrides.yaml, so the constraints file is left as is.
+            self._load_capabilities(written_config)
 
             # Verify that the reload was successful
             if not self._capabilities:
@@ -1753,12 +2273,17 @@ class ModelRegistry:
                     message="Registry update failed: could not load capabilities after update",
                 )
 
+            # Remember the applied revision so later checks can send a conditional GET
+            if self._remote_validators:
+                self._save_cache_metadata(self._remote_validators)
+
             # Log success
             log_info(
                 LogEvent.MODEL_REGISTRY,
                 "Registry updated from remote",
                 version=remote_config.get("version", "unknown"),
             )
+            self._record_remote_check(url)
 
             return RefreshResult(
                 success=True,
@@ -1781,6 +2306,27 @@ class ModelRegistry:
     def check_for_updates(self, url: Optional[str] = None) -> RefreshResult:
         """Check if updates are available for the model registry.
 
+        Args:
+            url: Optional custom URL to check for updates
+
+        Returns:
+            Result of the update check
+        """
+        if self._within_refresh_ttl(url):
+            return RefreshResult(
+                success=True,
+                status=RefreshStatus.ALREADY_CURRENT,
+                message="Registry was updated recently; skipping remote check",
+            )
+
+        result = self._check_remote_for_updates(url)
+        if result.status == RefreshStatus.ALREADY_CURRENT:
+            self._record_remote_check(url)
+        return result
+
+    def _check_remote_for_updates(self, url: Optional[str] = None) -> RefreshResult:
+        """Ask the remote source whether updates are available.
+
         Args:
             url: Optional custom URL to check for updates
 
@@ -1797,111 +2343,74 @@ class ModelRegistry:
             )
 
         # Set up the URL with fallback handling
-        primary_url = url or (
-            "https://raw.githubusercontent.com/yaniv-golan/openai-model-registry/main/data/models.yaml"
-        )
-
-        # Define fallback URLs in case primary fails
-        fallback_urls = [
-            "https://github.com/yaniv-golan/openai-model-registry/raw/main/data/models.yaml",
-        ]
-
-        urls_to_try = [primary_url] + fallback_urls
+        urls_to_try = [url or _DEFAULT_REGISTRY_URL, *_FALLBACK_REGISTRY_URLS]
 
         try:
-            # Use a lock when checking and comparing versions to prevent race conditions
-            with self.__class__._instance_lock:
-                # First check with DataManager
-                if self._data_manager.should_update_data():
-                    latest_release = self._data_manager._fetch_latest_data_release()
-                    if latest_release:
-                        latest_version = latest_release.get("tag_name", "")
-                        current_version = self._data_manager._get_current_version()
-                        if (
-                            current_version
-                            and self._data_manager._compare_versions(latest_version, current_version) <= 0
-                        ):
-                            return RefreshResult(
-                                success=True,
-                                status=RefreshStatus.ALREADY_CURRENT,
-                                message=f"Registry is up to date (version {current_version})",
-                            )
-                        else:
-                            return RefreshResult(
-                                success=True,
-                                status=RefreshStatus.UPDATE_AVAILABLE,
-                                message=f"Update available: {current_version or 'bundled'} -> {latest_version}",
-                            )
-
-                # Fallback to original HTTP check with URL fallback
-                remote_config = None
-                for config_url in urls_to_try:
-                    try:
-                        response = requests.get(config_url, timeout=10)
-                        response.raise_for_status()
+            # First check with DataManager
+            if self._data_manager.should_update_data():
+                latest_release = self._data_manager._fetch_latest_data_release()
+                if latest_release:
+                    latest_version = latest_release.get("tag_name", "")
+                    current_version = self._data_manager._get_current_version()
+                    if current_version and self._data_manager._compare_versions(latest_version, current_version) <= 0:
+                        return RefreshResult(
+                            success=True,
+                            status=RefreshStatus.ALREADY_CURRENT,
+                            message=f"Registry is up to date (version {current_version})",
+                        )
+                    else:
+                        return RefreshResult(
+                            success=True,
+                            status=RefreshStatus.UPDATE_AVAILABLE,
+                            message=f"Update available: {current_version or 'bundled'} -> {latest_version}",
+                        )
 
-                        # Parse the remote config
-                        remote_config = yaml.safe_load(response.text)
-                        if isinstance(remote_config, dict):
-                            break
-                        else:
-                            log_warning(
-                                LogEvent.MODEL_REGISTRY,
-                                f"Remote config from {config_url} is not a valid dictionary",
-                            )
-                    except (requests.RequestException, yaml.YAMLError) as e:
+            # Fallback to original HTTP check with URL fallback. The
+            # validators saved after the last applied update let the server
+            # answer 304 without a body when nothing changed.
+            headers = self._get_conditional_headers()
+            remote_version: Optional[str] = None
+            for config_url in urls_to_try:
+                try:
+                    status_code, is_mapping, version = self._peek_remote_version(config_url, headers)
+                    if status_code == 304:
+                        return RefreshResult(
+                            success=True,
+                            status=RefreshStatus.ALREADY_CURRENT,
+                            message="Registry is up to date (not modified since last update)",
+                        )
+                    if status_code not in (200, 206):
+                        # Plain status check; no HTTPError raised and caught per URL
                         log_warning(
                             LogEvent.MODEL_REGISTRY,
-                            f"Failed to fetch from {config_url}: {e}",
+                            f"Failed to fetch from {config_url}: HTTP {status_code}",
                         )
                         continue
 
-                if remote_config is None:
-                    return RefreshResult(
-                        success=False,
-                        status=RefreshStatus.ERROR,
-                        message="Could not fetch remote config from any URL",
-                    )
-
-                # Get local config for comparison
-                local_config = self._load_config()
-                if not local_config.success:
-                    return RefreshResult(
-                        success=False,
-                        status=RefreshStatus.ERROR,
-                        message=f"Could not load local config: {local_config.error}",
-                    )
-
-                # Compare versions (simplified comparison)
-                remote_version = remote_config.get("version", "unknown")
-                local_version = local_config.data.get("version", "unknown") if local_config.data else "unknown"
-
-                if remote_version == local_version:
-                    return RefreshResult(
-                        success=True,
-                        status=RefreshStatus.ALREADY_CURRENT,
-                        message=f"Registry is up to date (version {local_version})",
-                    )
-                else:
-                    return RefreshResult(
-                        success=True,
-                        status=RefreshStatus.UPDATE_AVAILABLE,
-                        message=f"Update available: {local_version} -> {remote_version}",
+                    if is_mapping:
+                        remote_version = version or "unknown"
+                        break
+                    else:
+                        log_warning(
+                            LogEvent.MODEL_REGISTRY,
+                            f"Remote config from {config_url} is not a valid dictionary",
+                        )
+                except (requests.RequestException, yaml.YAMLError) as e:
+                    log_warning(
+                        LogEvent.MODEL_REGISTRY,
+                        f"Failed to fetch from {config_url}: {e}",
                     )
+                    continue
 
-        except requests.HTTPError as e:
-            if e.response.status_code == 404:
+            if remote_version is None:
                 return RefreshResult(
                     success=False,
                     status=RefreshStatus.ERROR,
-                    message="Registry not found at any of the configured URLs",
-                )
-            else:
-                return RefreshResult(
-                    success=False,
-                    status=RefreshStatus.ERROR,
-                    message=f"HTTP error {e.response.status_code}: {e}",
+                    message="Could not fetch remote config from any URL",
                 )
+
+            return self._compare_remote_version(remote_version)
+
         except requests.RequestException as e:
             return RefreshResult(
                 success=False,
@@ -1915,6 +2424,145 @@ class ModelRegistry:
                 message=f"Unexpected error: {e}",
             )
 
+    def _peek_remote_version(self, url: str, headers: Dict[str, str]) -> Tuple[int, bool, Optional[str]]:
+        """Read the top-level ``version`` of a remote registry file.
+
+        Only the head of the file is requested; the full file is fetched when
+        the version key does not appear within that range.
+
+        Args:
+            url: URL of the remote registry file
+            headers: Conditional request headers to send
+
+        Returns:
+            ``(status_code, is_mapping, version)`` as described by
+            ``_scan_top_level_scalar``; the scan fields are only meaningful
+            for 200 and 206 responses
+
+        Raises:
+            requests.RequestException: If a request fails
+            yaml.YAMLError: If a complete response is not valid YAML
+        """
+        session = self._get_session()
+        response = session.get(url, timeout=_HTTP_TIMEOUT, headers={**headers, "Range": _VERSION_PEEK_RANGE})
+        if response.status_code == 206:
+            try:
+                is_mapping, version = _scan_top_level_scalar(response.content, "version", complete=False)
+            except yaml.YAMLError:
+                # The range cut the document off before the key was reached
+                is_mapping, version = True, None
+            # Only a fully read version is trusted; anything else is settled
+            # by the complete document
+            if is_mapping and version is not None:
+                return 206, is_mapping, version
+            response = session.get(url, timeout=_HTTP_TIMEOUT, headers=headers)
+        if response.status_code != 200:
+            return response.status_code, False, None
+        # Servers that ignore Range answer 200 with the whole file
+        is_mapping, version = _scan_top_level_scalar(response.content, "version")
+        return 200, is_mapping, version
+
+    def _remote_check_stamp_path(self, url: Optional[str] = None) -> Path:
+        """Get the file whose mtime records the last successful check of ``url``.
+
+        The stamp is keyed by the data directory, the revision of the local
+        models.yaml the registry loads and the remote URL, so a check only
+        vouches for the same local data against the same source.
+
+        Args:
+            url: Remote registry URL, or None for the default
+
+        Returns:
+            Path of the stamp file
+
+        Raises:
+            OSError: If the local models.yaml cannot be stat'ed
+        """
+        local_path: Optional[Path] = None
+        env_path = os.getenv("OMR_MODEL_REGISTRY_PATH")
+        if env_path and Path(env_path).exists():
+            local_path = Path(env_path)
+        else:
+            local_path = self._data_manager.get_data_file_path("models.yaml")
+        if local_path is None:
+            local = "bundled"
+        else:
+            st = os.stat(local_path)
+            local = f"{local_path.resolve()}|{st.st_mtime_ns}|{st.st_size}"
+        key = f"{self._data_manager._data_dir}|{local}|{url or _DEFAULT_REGISTRY_URL}"
+        digest = hashlib.blake2b(key.encode("utf-8"), digest_size=16).hexdigest()
+        return get_user_cache_dir() / _REMOTE_CHECK_DIR / digest
+
+    def _record_remote_check(self, url: Optional[str] = None) -> None:
+        """Remember that the remote data was just confirmed current or applied.
+
+        Nothing is written unless ``config.refresh_ttl`` is enabled.
+
+        Args:
+            url: Remote registry URL that was checked, or None for the default
+        """
+        if self.config.refresh_ttl <= 0:
+            return
+        try:
+            stamp = self._remote_check_stamp_path(url)
+            stamp.parent.mkdir(parents=True, exist_ok=True)
+            stamp.touch()
+        except OSError as e:
+            log_debug(LogEvent.MODEL_REGISTRY, "Could not record remote check", error=str(e))
+
+    def _within_refresh_ttl(self, url: Optional[str] = None) -> bool:
+        """Check whether ``url`` was last checked within ``config.refresh_ttl``.
+
+        Args:
+            url: Remote registry URL, or None for the default
+
+        Returns:
+            True if remote checks can be skipped, False otherwise
+        """
+        ttl = self.config.refresh_ttl
+        if ttl <= 0:
+            return False
+        try:
+            return time.time() - os.stat(self._remote_check_stamp_path(url)).st_mtime < ttl
+        except OSError:
+            return False
+
+    def _compare_remote_version(self, remote_version: str) -> RefreshResult:
+        """Compare a remote registry version with the locally loaded data.
+
+        Args:
+            remote_version: The ``version`` declared by the remote registry
+
+        Returns:
+            Result of the comparison
+        """
+        # Only the local read needs the lock; network round trips done by the
+        # callers run without it so other threads are not blocked on I/O
+        with self.__class__._instance_lock:
+            local_config = self._load_config()
+        if not local_config.success:
+            return RefreshResult(
+                success=False,
+                status=RefreshStatus.ERROR,
+                message=f"Could not load local config: {local_config.error}",
+            )
+
+        # Compare versions (simplified comparison)
+        local_version = local_config.data.get("version", "unknown") if local_config.data else "unknown"
+
+        if remote_version == str(local_version):
+            return RefreshResult(
+                success=True,
+                status=RefreshStatus.ALREADY_CURRENT,
+                message=f"Registry is up to date (version {local_version})",
+            )
+        else:
+            return RefreshResult(
+                success=True,
+                status=RefreshStatus.UPDATE_AVAILABLE,
+                message=f"Update available: {local_version} -> {remote_version}",
+            )
+
     def check_data_updates(self) -> bool:
         """Check if data updates are available using DataManager.
 
@@ -2217,6 +2865,8 @@ class ModelRegistry:
     def cleanup() -> None:
         """Clean up the registry instance."""
         with ModelRegistry._instance_lock:
+            if ModelRegistry._default_instance is not None:
+                ModelRegistry._default_instance._clear_capabilities_cache()
             ModelRegistry._default_instance = None
 
     def list_providers(self) -> List[str]:
@@ -2248,7 +2898,6 @@ class ModelRegistry:
             Dictionary containing the effective model capabilities after provider overrides
         """
         import os
-        from datetime import datetime
 
         current_provider = os.getenv("OMR_PROVIDER", "openai").lower()
         effective_data: Dict[str, Any] = {}
@@ -2345,7 +2994,6 @@ class ModelRegistry:
             Dictionary with 'models' and 'overrides' keys containing file paths or None if bundled
         """
         import os
-        from pathlib import Path
 
         paths: Dict[str, Optional[str]] = {}
 
@@ -2435,14 +3083,14 @@ class ModelRegistry:
                 with open(models_path, "r") as f:
                     import yaml
 
-                    raw_data = yaml.safe_load(f)
+                    raw_data = yaml.load(f, Loader=_YamlLoader)
             else:
                 # Load from bundled data
                 content = self.get_bundled_data_content("models.yaml")
                 if content:
                     import yaml
 
-                    raw_data = yaml.safe_load(content)
+                    raw_data = yaml.load(content, Loader=_YamlLoader)
                 else:
                     return None
 
@@ -2462,10 +3110,13 @@ class ModelRegistry:
             return None
 
     @property
-    def models(self) -> Dict[str, ModelCapabilities]:
-        """Get a read-only view of registered models."""
-        with self._capabilities_lock:
-            return dict(self._capabilities)
+    def models(self) -> Mapping[str, ModelCapabilities]:
+        """Get a read-only view of registered models.
+
+        The view is shared between calls without copying. A reload publishes
+        a new view, so a view already obtained stays a stable snapshot.
+        """
+        return self._models_view
 
 
 def get_registry() -> ModelRegistry:
@@ -0,0 +1,18 @@
+"""Shared pytest fixtures."""
+
+from pathlib import Path
+
+import pytest
+
+from openai_model_registry import config_paths, registry
+
+
+@pytest.fixture(autouse=True)
+def isolated_user_cache_dir(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Keep tests from writing to the real user cache directory."""
+    cache_dir = tmp_path / "user-cache"
+    monkeypatch.setenv("XDG_CACHE_HOME", str(cache_dir))
+    monkeypatch.setattr(config_paths, "get_user_cache_dir", lambda: cache_dir)
+    # registry.py imports the function by name, so patch its reference too
+    monkeypatch.setattr(registry, "get_user_cache_dir", lambda: cache_dir)
+    return cache_dir
@@ -94,7 +94,7 @@ class TestDataDump:
         mock_path.return_value = mock_path_instance
 
         # Mock file reading and YAML parsing
-        mock_yaml.safe_load.side_effect = [
+        mock_yaml.load.side_effect = [
             {"claude-3": {"provider": "anthropic"}},  # models.yaml
             {},  # overrides.yaml
         ]
@@ -1,10 +1,13 @@
 """Tests for the constraint classes."""
 
+import dataclasses
+
 import pytest
 
 from openai_model_registry.constraints import (
     EnumConstraint,
     NumericConstraint,
+    ObjectConstraint,
     ParameterReference,
 )
 from openai_model_registry.errors import ModelRegistryError
@@ -24,6 +27,15 @@ def test_parameter_reference() -> None:
     assert ref.description == "Max tokens"
     assert ref.max_value == 100.0
 
+    # Short name is derived from the full reference and ignored in equality
+    ref = ParameterReference("numeric_constraints.temperature")
+    assert ref.short_name == "temperature"
+    assert ref == ParameterReference("numeric_constraints.temperature")
+
+    # References are shared between models, so they cannot be modified
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        ref.max_value = 1.0  # type: ignore[misc]
+
 
 def test_numeric_constraint_initialization() -> None:
     """Test NumericConstraint initialization."""
@@ -178,3 +190,31 @@ def test_enum_constraint_validation() -> None:
     with pytest.raises(ModelRegistryError) as exc_info:
         constraint.validate("test_param", 123)
     assert "must be a string" in str(exc_info.value)
+
+
+def test_constraints_from_mapping() -> None:
+    """Test building constraints from constraints-file mappings."""
+    numeric = NumericConstraint.from_mapping({"type": "numeric", "min_value": 0, "max_value": 2.0})
+    assert numeric.min_value == 0
+    assert numeric.max_value == 2.0
+    assert numeric.allow_float is True
+    assert NumericConstraint.from_mapping({"type": "numeric"}).min_value == 0.0
+
+    enum = EnumConstraint.from_mapping({"type": "enum", "allowed_values": ["low", "high"], "description": "Effort"})
+    assert enum.allowed_values == ["low", "high"]
+    assert enum.description == "Effort"
+
+    obj = ObjectConstraint.from_mapping({"type": "object", "required_keys": ["a"]})
+    assert obj.required_keys == ["a"]
+    assert obj.allowed_keys is None
+
+    with pytest.raises(ValueError, match="non-numeric 'max_value'"):
+        NumericConstraint.from_mapping({"max_value": "high"})
+    with pytest.raises(ValueError, match="non-boolean"):
+        NumericConstraint.from_mapping({"allow_float": "yes"})
+    with pytest.raises(ValueError, match="missing required 'allowed_values'"):
+        EnumConstraint.from_mapping({})
+    with pytest.raises(ValueError, match="non-string values"):
+        EnumConstraint.from_mapping({"allowed_values": ["low", 1]})
+    with pytest.raises(ValueError, match="non-list 'allowed_keys'"):
+        ObjectConstraint.from_mapping({"allowed_keys": "a"})
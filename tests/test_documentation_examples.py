@@ -100,11 +100,9 @@ class TestBasicUsageExamples:
         capabilities._constraints = constraints
 
         # Add parameter references
-        param_temp = ParameterReference(ref="temperature")
-        param_temp.description = "Controls randomness"
+        param_temp = ParameterReference(ref="temperature", description="Controls randomness")
 
-        param_effort = ParameterReference(ref="reasoning_effort")
-        param_effort.description = "Controls reasoning effort"
+        param_effort = ParameterReference(ref="reasoning_effort", description="Controls reasoning effort")
 
         capabilities.supported_parameters = [param_temp, param_effort]
 
@@ -241,11 +239,9 @@ class TestAdvancedExamples:
         )
 
         # Add supported parameters manually
-        param_temp = ParameterReference(ref="temperature")
-        param_temp.description = "Controls randomness"
+        param_temp = ParameterReference(ref="temperature", description="Controls randomness")
 
-        param_tokens = ParameterReference(ref="max_tokens")
-        param_tokens.description = "Maximum tokens"
+        param_tokens = ParameterReference(ref="max_tokens", description="Maximum tokens")
 
         capabilities.supported_parameters = [param_temp, param_tokens]
 
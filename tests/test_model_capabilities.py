@@ -15,7 +15,13 @@ from openai_model_registry.errors import (
     ParameterNotSupportedError,
 )
 from openai_model_registry.model_version import ModelVersion
-from openai_model_registry.registry import ModelCapabilities
+from openai_model_registry.registry import (
+    SUPPORTS_FUNCTIONS,
+    SUPPORTS_STREAMING,
+    SUPPORTS_STRUCTURED,
+    SUPPORTS_VISION,
+    ModelCapabilities,
+)
 
 
 def _create_test_deprecation() -> DeprecationInfo:
@@ -75,6 +81,56 @@ def test_model_capabilities_initialization() -> None:
     assert capabilities.supported_parameters[0].ref == "temperature"
 
 
+def test_model_capabilities_flags() -> None:
+    """Test that capability booleans are packed into the flags bitmask."""
+    capabilities = ModelCapabilities(
+        model_name="test-model",
+        openai_model_name="test-model",
+        context_window=4096,
+        max_output_tokens=2048,
+        deprecation=_create_test_deprecation(),
+        supports_streaming=True,
+        supports_structured=True,
+    )
+
+    assert capabilities.flags == SUPPORTS_STREAMING | SUPPORTS_STRUCTURED
+    assert capabilities.flags & (SUPPORTS_STREAMING | SUPPORTS_STRUCTURED) == SUPPORTS_STREAMING | SUPPORTS_STRUCTURED
+    assert not capabilities.flags & (SUPPORTS_VISION | SUPPORTS_FUNCTIONS)
+    assert capabilities.supports_web_search is False
+
+
+def test_model_capabilities_prepacked_flags() -> None:
+    """Test that packed flags are stored as given."""
+    capabilities = ModelCapabilities(
+        model_name="test-model",
+        openai_model_name="test-model",
+        context_window=4096,
+        max_output_tokens=2048,
+        deprecation=_create_test_deprecation(),
+        supports_streaming=True,
+        flags=SUPPORTS_VISION | SUPPORTS_FUNCTIONS,
+    )
+
+    assert capabilities.flags == SUPPORTS_VISION | SUPPORTS_FUNCTIONS
+    assert capabilities.supports_vision is True
+    assert capabilities.supports_streaming is False
+
+
+def test_model_capabilities_uses_slots() -> None:
+    """Test that ModelCapabilities instances carry no per-instance __dict__."""
+    capabilities = ModelCapabilities(
+        model_name="test-model",
+        openai_model_name="test-model",
+        context_window=4096,
+        max_output_tokens=2048,
+        deprecation=_create_test_deprecation(),
+    )
+
+    assert not hasattr(capabilities, "__dict__")
+    with pytest.raises(AttributeError):
+        capabilities.unknown_attribute = True  # type: ignore[attr-defined]
+
+
 def test_model_capabilities_get_constraint() -> None:
     """Test ModelCapabilities.get_constraint method."""
     # Create constraints
@@ -155,6 +211,37 @@ def test_model_capabilities_validate_parameter() -> None:
         capabilities.validate_parameter("reasoning_effort", "extreme")
 
 
+def test_model_capabilities_parameter_lookup_by_ref_and_short_name() -> None:
+    """Test that parameters resolve by full reference and by short name."""
+    capabilities = ModelCapabilities(
+        model_name="test-model",
+        openai_model_name="test-model",
+        context_window=4096,
+        max_output_tokens=2048,
+        deprecation=_create_test_deprecation(),
+        supported_parameters=[
+            ParameterReference(ref="numeric_constraints.temperature", description="Controls randomness"),
+        ],
+        constraints={
+            "numeric_constraints.temperature": NumericConstraint(min_value=0.0, max_value=2.0),
+            "enum_constraints.reasoning_effort": EnumConstraint(allowed_values=["low", "medium", "high"]),
+        },
+    )
+
+    capabilities.validate_parameter("temperature", 0.7)
+    capabilities.validate_parameter("numeric_constraints.temperature", 0.7)
+    with pytest.raises(ParameterNotSupportedError):
+        capabilities.validate_parameter("reasoning_effort", "low")
+
+    # Reassigning the list rebuilds the lookup
+    capabilities.supported_parameters = [
+        ParameterReference(ref="enum_constraints.reasoning_effort", description="Controls reasoning effort"),
+    ]
+    capabilities.validate_parameter("reasoning_effort", "low")
+    with pytest.raises(ParameterNotSupportedError):
+        capabilities.validate_parameter("temperature", 0.7)
+
+
 def test_model_capabilities_validate_parameters() -> None:
     """Test ModelCapabilities.validate_parameters method."""
     # Create capabilities with constraints
@@ -218,6 +305,10 @@ def test_model_capabilities_validate_parameters() -> None:
             }
         )
 
+    # Unsupported parameters are reported with the same error as validate_parameter
+    with pytest.raises(ParameterNotSupportedError):
+        capabilities.validate_parameters({"temperature": 0.7, "nonexistent": "value"})
+
 
 def test_web_search_capability() -> None:
     """Test web search capability tracking."""
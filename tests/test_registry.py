@@ -1,20 +1,31 @@
 """Tests for the model registry functionality."""
 
+import gc
 import os
+import subprocess
+import sys
+import weakref
 from pathlib import Path
 from typing import Generator
+from unittest import mock
 
 import pytest
 import yaml
 
 from openai_model_registry import (
+    SUPPORTS_STREAMING,
+    SUPPORTS_STRUCTURED,
+    SUPPORTS_VISION,
+    ModelCapabilities,
     ModelRegistry,
     ModelRegistryError,
 )
+from openai_model_registry import registry as registry_module
+from openai_model_registry.constraints import NumericConstraint
 from openai_model_registry.errors import (
     ModelNotSupportedError,
 )
-from openai_model_registry.registry import RegistryConfig
+from openai_model_registry.registry import RegistryConfig, _parse_yaml_text, _scan_top_level_scalar
 
 
 @pytest.fixture
@@ -316,3 +327,227 @@ def test_default_registry_instance() -> None:
     # Test backwards compatibility
     registry3 = ModelRegistry.get_instance()
     assert registry3 is registry1
+
+
+def test_filter_by_context(registry: ModelRegistry) -> None:
+    """Test filtering models by minimum token limits."""
+    assert set(registry.filter_by_context(100000)) == {"gpt-4o", "gpt-4o-2024-05-13"}
+    assert set(registry.filter_by_context(0)) == set(registry.models)
+    assert set(registry.filter_by_context(4096, min_output_tokens=4096)) == {"gpt-4o", "gpt-4o-2024-05-13"}
+    assert registry.filter_by_context(200000) == []
+
+
+def test_filter_by_flags(registry: ModelRegistry) -> None:
+    """Test filtering models by capability flags."""
+    assert set(registry.filter_by_flags(SUPPORTS_STREAMING | SUPPORTS_STRUCTURED)) == set(registry.models)
+    assert set(registry.filter_by_flags(SUPPORTS_VISION)) == {"gpt-4o", "gpt-4o-2024-05-13"}
+
+
+def test_reload_invalidates_capabilities_cache(registry: ModelRegistry) -> None:
+    """Test that reloading capabilities drops previously cached lookups."""
+    before = registry.get_capabilities("test-model")
+    assert registry.get_capabilities("test-model") is before
+
+    registry._load_capabilities()
+
+    after = registry.get_capabilities("test-model")
+    assert after is not before
+    assert after is registry.models["test-model"]
+
+
+def test_constraints_reparsed_after_file_change(registry: ModelRegistry) -> None:
+    """Test that the YAML parse cache picks up edits to the constraints file."""
+    constraints_path = registry.config.constraints_path
+    assert constraints_path is not None
+    with open(constraints_path) as f:
+        data = yaml.safe_load(f)
+    data["numeric_constraints"]["temperature"]["max_value"] = 1.5
+    with open(constraints_path, "w") as f:
+        yaml.dump(data, f)
+    # Same size, so force a distinct mtime to exercise the cache key
+    st = os.stat(constraints_path)
+    os.utime(constraints_path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+
+    registry._load_constraints()
+
+    constraint = registry.get_parameter_constraint("numeric_constraints.temperature")
+    assert isinstance(constraint, NumericConstraint)
+    assert constraint.max_value == 1.5
+
+
+def test_models_share_registry_constraints(registry: ModelRegistry) -> None:
+    """Test that loaded models reference the registry constraints without copying."""
+    for capabilities in registry.models.values():
+        assert capabilities._constraints is registry._constraints
+
+
+def test_models_share_parameter_references(registry: ModelRegistry) -> None:
+    """Test that models accepting the same parameter share one reference object."""
+    test_temperature = registry.models["test-model"]._param_by_name["temperature"]
+    gpt_temperature = registry.models["gpt-4o"]._param_by_name["temperature"]
+    assert test_temperature is gpt_temperature
+
+
+def test_models_view_is_stable_across_reload(registry: ModelRegistry) -> None:
+    """Test that a reload during iteration of ``models`` does not disturb the view."""
+    view = registry.models
+    names = list(view)
+
+    for _name in view:
+        registry._load_capabilities_modern({"added-model": {"context_window": 1000, "max_output_tokens": 100}})
+
+    assert list(view) == names
+    assert "added-model" in registry.models
+    assert "added-model" not in view
+
+
+def test_registries_do_not_share_mutable_data(registry: ModelRegistry) -> None:
+    """Test that changes made through one registry do not leak into others."""
+    existing = ModelRegistry(registry.config)
+
+    caps = registry.get_capabilities("gpt-4o")
+    caps.inline_parameters["temperature"]["max_value"] = 99.0
+    caps.inline_parameters["injected"] = {"type": "numeric"}
+    caps.input_modalities.append("smell")
+
+    for other in (existing, ModelRegistry(registry.config)):
+        other_caps = other.get_capabilities("gpt-4o")
+        assert other_caps.inline_parameters["temperature"]["max_value"] == 2.0
+        assert "injected" not in other_caps.inline_parameters
+        assert "smell" not in other_caps.input_modalities
+
+
+def test_parse_cache_returns_private_copies() -> None:
+    """Test that the YAML parse cache hands every caller its own structure."""
+    text = "models:\n  a: {tags: [x]}\n"
+    first = _parse_yaml_text(text)
+    first["models"]["a"]["tags"].append("y")
+
+    assert _parse_yaml_text(text) == {"models": {"a": {"tags": ["x"]}}}
+    # Entries are keyed by digest rather than by the document text
+    assert all(isinstance(key, bytes) for key in registry_module._parsed_yaml_texts)
+
+
+def test_split_dated_model_names() -> None:
+    """Test splitting dated model names into base name and date."""
+    assert ModelRegistry._split_dated("gpt-4o-2024-08-06") == ("gpt-4o", "2024-08-06")
+    assert ModelRegistry._split_dated("o1-mini-2024-09-12") == ("o1-mini", "2024-09-12")
+    assert ModelRegistry._split_dated("gpt-4o") is None
+    assert ModelRegistry._split_dated("gpt-4o-mini") is None
+    assert ModelRegistry._split_dated("gpt-4o-2024-8-06") is None
+    assert ModelRegistry._split_dated("gpt-4o-2024x08-06") is None
+
+
+def test_capabilities_cache_is_bounded(registry: ModelRegistry) -> None:
+    """Test that cached lookups respect the configured cache size."""
+    registry.config.cache_size = 2
+    registry._clear_capabilities_cache()
+
+    first = registry.get_capabilities("gpt-4o-2024-06-01")
+    assert registry.get_capabilities("gpt-4o-2024-06-01") is first
+
+    registry.get_capabilities("gpt-4o-2024-07-01")
+    registry.get_capabilities("gpt-4o-2024-08-01")
+
+    assert "gpt-4o-2024-06-01" not in registry._caps_cache
+    assert "gpt-4o-2024-07-01" in registry._caps_cache
+    assert "gpt-4o-2024-08-01" in registry._caps_cache
+    # Registered names are seeded and never evicted
+    assert all(name in registry._caps_cache for name in registry.models)
+
+
+def test_cache_clear_drops_derived_lookups(registry: ModelRegistry) -> None:
+    """Test that the public cache_clear() resets cached lookups."""
+    first = registry.get_capabilities("gpt-4o-2024-06-01")
+    registry.cache_clear()
+
+    assert "gpt-4o-2024-06-01" not in registry._caps_cache
+    assert registry.get_capabilities("gpt-4o-2024-06-01") is not first
+    assert all(name in registry._caps_cache for name in registry.models)
+
+
+def test_lookup_racing_reload_is_not_cached(registry: ModelRegistry) -> None:
+    """Test that a lookup resolved before a reload does not outlive it."""
+    resolve = registry._get_capabilities_impl
+
+    def resolve_then_reload(model: str) -> ModelCapabilities:
+        capabilities = resolve(model)
+        registry._clear_capabilities_cache()
+        return capabilities
+
+    with mock.patch.object(registry, "_get_capabilities_impl", side_effect=resolve_then_reload):
+        stale = registry.get_capabilities("gpt-4o-2024-06-01")
+
+    assert "gpt-4o-2024-06-01" not in registry._caps_cache
+    assert registry.get_capabilities("gpt-4o-2024-06-01") is not stale
+
+
+def test_dated_variant_keeps_base_capabilities(registry: ModelRegistry) -> None:
+    """Test that a resolved dated variant carries everything but the OpenAI name."""
+    base = registry.get_capabilities("test-model-2024-01-01")
+    variant = registry.get_capabilities("test-model-2024-06-01")
+
+    assert variant is not base
+    assert variant.openai_model_name == "test-model-2024-06-01"
+    assert base.openai_model_name == "test-model-2024-01-01"
+    assert variant.model_name == base.model_name
+    assert variant.inline_parameters == base.inline_parameters
+    assert variant.web_search_billing is base.web_search_billing
+
+    variant.validate_parameter("temperature", 0.7)
+    with pytest.raises(ModelRegistryError):
+        variant.validate_parameter("temperature", 3.0)
+
+
+def test_registry_freed_without_gc(registry: ModelRegistry) -> None:
+    """Test that a registry is released by reference counting once dropped."""
+    # Keep the cycle collector from freeing the registry behind our back
+    gc.disable()
+    try:
+        short_lived = ModelRegistry(registry.config)
+        short_lived.get_capabilities("test-model")
+        short_lived.get_capabilities("test-model-2024-06-01")
+        ref = weakref.ref(short_lived)
+
+        del short_lived
+
+        assert ref() is None
+    finally:
+        gc.enable()
+
+
+def test_import_does_not_load_requests() -> None:
+    """Test that importing the package leaves the HTTP stack unloaded."""
+    code = "import sys, openai_model_registry; print('requests' in sys.modules)"
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+
+    assert result.stdout.strip() == "False"
+
+
+def test_scan_top_level_scalar() -> None:
+    """Test reading a top-level key from the YAML event stream."""
+    assert _scan_top_level_scalar(b"version: 1.2.0\nmodels: {a: 1}\n", "version") == (True, "1.2.0")
+    # Nested keys of the same name are not mistaken for the top-level one
+    doc = b"models:\n  m:\n    version: 9\n  n: [1, 2]\nversion: '2.0'\n"
+    assert _scan_top_level_scalar(doc, "version") == (True, "2.0")
+    assert _scan_top_level_scalar(b"models: {}\n", "version") == (True, None)
+    assert _scan_top_level_scalar(b"- version\n", "version") == (False, None)
+    assert _scan_top_level_scalar(b"", "version") == (False, None)
+    # Plain scalars are typed as a full load would; quoted ones stay as written
+    assert _scan_top_level_scalar(b"version: 1.10\n", "version") == (True, str(yaml.safe_load("1.10")))
+    assert _scan_top_level_scalar(b"version: '1.10'\n", "version") == (True, "1.10")
+    assert _scan_top_level_scalar(b"version: null\n", "version") == (True, None)
+
+
+def test_scan_top_level_scalar_partial_document() -> None:
+    """Test that a value cut short by the end of a partial document is not returned."""
+    doc = b"version: 1.2.0\nmodels:\n  gpt-4o: {}\n"
+    for end in range(len(doc) + 1):
+        try:
+            _, version = _scan_top_level_scalar(doc[:end], "version", complete=False)
+        except yaml.YAMLError:
+            continue
+        assert version in (None, "1.2.0")
+    # The value is accepted once the following key has been read
+    assert _scan_top_level_scalar(doc[:22], "version", complete=False) == (True, "1.2.0")
+    assert _scan_top_level_scalar(b"version: 1.2", "version", complete=False) == (True, None)
@@ -1,14 +1,19 @@
 """Tests for advanced registry functionality to improve code coverage."""
 
+import json
 import os
+import threading
+import time
 from pathlib import Path
-from typing import Generator
+from typing import Generator, List, Mapping
 from unittest.mock import MagicMock, patch
 
 import pytest
 import requests
 import yaml
 
+from openai_model_registry.config_result import ConfigResult
+from openai_model_registry.data_manager import DataManager
 from openai_model_registry.errors import (
     ConstraintNotFoundError,
     InvalidDateError,
@@ -20,6 +25,8 @@ from openai_model_registry.registry import (
     ModelRegistry,
     RefreshStatus,
     RegistryConfig,
+    _write_bytes_if_changed,
+    _write_text_atomic,
 )
 
 
@@ -182,6 +189,12 @@ class TestRegistryVersionHandling:
         # Alias suggestion field removed – ensure core details are still correct
         assert exc_info.value.alias is None
 
+    def test_newer_version_resolves_to_highest_min_version(self, simple_registry: ModelRegistry) -> None:
+        """Test that a newer dated request uses the entry with the highest minimum version."""
+        capabilities = simple_registry.get_capabilities("gpt-4o-2024-06-01")
+        assert capabilities.model_name == "gpt-4o-2024-05-13"
+        assert capabilities.openai_model_name == "gpt-4o-2024-06-01"
+
     def test_invalid_date_format(self, simple_registry: ModelRegistry) -> None:
         """Test error when date format is invalid."""
         with pytest.raises(InvalidDateError):
@@ -214,6 +227,7 @@ class TestRegistryVersionHandling:
         # Remove the registered dated model to test this case
         model_key = "gpt-4o-2024-05-13"
         original_capability = simple_registry._capabilities.pop(model_key, None)
+        simple_registry._build_indexes()
 
         try:
             with pytest.raises(ModelNotSupportedError) as exc_info:
@@ -225,6 +239,7 @@ class TestRegistryVersionHandling:
             # Restore the capability
             if original_capability:
                 simple_registry._capabilities[model_key] = original_capability
+                simple_registry._build_indexes()
 
 
 class TestModelCapabilities:
@@ -312,16 +327,20 @@ class TestModelCapabilities:
     def test_models_property(self, simple_registry: ModelRegistry) -> None:
         """Test the models property."""
         models = simple_registry.models
-        assert isinstance(models, dict)
+        assert isinstance(models, Mapping)
         assert "gpt-4o" in models
         assert "gpt-4o-2024-05-13" in models
 
-        # Should be a copy, not the original
+        # Should be a read-only view, not the original dict
         original_len = len(simple_registry._capabilities)
-        # Verify that modifying the returned dict doesn't affect the original
         assert id(models) != id(simple_registry._capabilities)
+        with pytest.raises(TypeError):
+            models["new-model"] = models["gpt-4o"]  # type: ignore[index]
         assert len(simple_registry._capabilities) == original_len  # Original unchanged
 
+        # Repeated access returns the same view without copying
+        assert simple_registry.models is models
+
 
 class TestRegistryRefresh:
     """Tests for registry refresh functionality with safer mocking approaches."""
@@ -362,6 +381,117 @@ class TestRegistryRefresh:
             assert result.status == RefreshStatus.ERROR
             assert "Failed to fetch" in result.message
 
+    def test_refresh_reuses_fetched_config_for_version_check(self, simple_registry: ModelRegistry) -> None:
+        """Test that refresh compares the fetched document instead of downloading it again."""
+        with (
+            patch.object(simple_registry, "_fetch_remote_config", return_value={"version": "1.0.0"}),
+            patch.object(simple_registry, "_validate_remote_config"),
+            patch.object(simple_registry._data_manager, "should_update_data", return_value=False),
+            patch.object(ModelRegistry, "_get_session") as mock_get_session,
+        ):
+            result = simple_registry.refresh_from_remote(url="https://example.com/test.yml")
+
+        mock_get_session.return_value.get.assert_not_called()
+        assert result.status == RefreshStatus.ALREADY_CURRENT
+
+    def test_fallback_refresh_reuses_written_config(
+        self, simple_registry: ModelRegistry, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that the fallback update loads the written document without re-reading it."""
+        remote_config = simple_registry._load_config().data
+        assert remote_config is not None
+        target_path = tmp_path / "models.yaml"
+        monkeypatch.delenv("OMR_MODEL_REGISTRY_PATH")
+
+        with (
+            patch.object(simple_registry, "_fetch_remote_config", return_value=remote_config),
+            patch.object(simple_registry, "_validate_remote_config"),
+            patch.object(simple_registry._data_manager, "force_update", return_value=False),
+            patch.object(simple_registry._data_manager, "get_data_file_path", return_value=target_path),
+            patch("openai_model_registry.registry.get_user_data_dir", return_value=tmp_path),
+            patch.object(ModelRegistry, "_get_session") as mock_get_session,
+            patch.object(simple_registry, "_load_config") as mock_load_config,
+        ):
+            mock_get_session.return_value.get.return_value = MagicMock(status_code=404)
+            result = simple_registry.refresh_from_remote(force=True)
+
+        assert result.status == RefreshStatus.UPDATED
+        assert yaml.safe_load(target_path.read_text()) == remote_config
+        mock_load_config.assert_not_called()
+        assert "old-model-2023-01-01" in simple_registry.models
+
+    def test_refresh_ttl_skips_remote_checks(self, simple_registry: ModelRegistry) -> None:
+        """Test that a recent successful check lets later calls skip the network."""
+        simple_registry.config.refresh_ttl = 3600
+        url = "https://example.com/test.yml"
+        stamp = simple_registry._remote_check_stamp_path(url)
+
+        with (
+            patch.object(simple_registry._data_manager, "should_update_data", return_value=False),
+            patch.object(ModelRegistry, "_get_session") as mock_get_session,
+        ):
+            mock_get = mock_get_session.return_value.get
+
+            # An available update is not recorded as a successful check
+            mock_get.return_value = MagicMock(status_code=200, content=b"version: 2.0.0\nmodels: {}\n")
+            assert simple_registry.check_for_updates(url=url).status == (RefreshStatus.UPDATE_AVAILABLE)
+            assert not stamp.exists()
+
+            # Already current, then called again: no further requests
+            mock_get.return_value = MagicMock(status_code=200, content=b"version: 1.0.0\nmodels: {}\n")
+            assert simple_registry.check_for_updates(url=url).status == (RefreshStatus.ALREADY_CURRENT)
+            assert mock_get.call_count == 2
+            assert simple_registry.check_for_updates(url=url).status == (RefreshStatus.ALREADY_CURRENT)
+            assert simple_registry.refresh_from_remote(url=url).status == RefreshStatus.ALREADY_CURRENT
+            assert mock_get.call_count == 2
+
+            # Once the last check is older than the TTL the remote is consulted again
+            old = time.time() - 7200
+            os.utime(stamp, (old, old))
+            simple_registry.check_for_updates(url=url)
+            assert mock_get.call_count == 3
+
+            # A check only vouches for the URL that was checked
+            simple_registry.check_for_updates(url="https://example.com/other.yml")
+            assert mock_get.call_count == 4
+
+    def test_refresh_ttl_is_per_local_data(
+        self,
+        simple_registry: ModelRegistry,
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Test that a recent check does not vouch for a different data directory or revision."""
+        simple_registry.config.refresh_ttl = 3600
+        url = "https://example.com/test.yml"
+        registries = []
+        for name in ("data-a", "data-b"):
+            monkeypatch.setenv("OMR_DATA_DIR", str(tmp_path / name))
+            registries.append(ModelRegistry(simple_registry.config))
+        first, second = registries
+
+        with (
+            patch.object(DataManager, "should_update_data", return_value=False),
+            patch.object(ModelRegistry, "_get_session") as mock_get_session,
+        ):
+            mock_get = mock_get_session.return_value.get
+            mock_get.return_value = MagicMock(status_code=200, content=b"version: 1.0.0\nmodels: {}\n")
+
+            assert first.check_for_updates(url=url).status == RefreshStatus.ALREADY_CURRENT
+            assert first.check_for_updates(url=url).status == RefreshStatus.ALREADY_CURRENT
+            assert mock_get.call_count == 1
+
+            # Another data directory has not been checked yet
+            assert second.check_for_updates(url=url).status == RefreshStatus.ALREADY_CURRENT
+            assert mock_get.call_count == 2
+
+            # Changing the local data invalidates the earlier check
+            models_path = Path(os.environ["OMR_MODEL_REGISTRY_PATH"])
+            later = models_path.stat().st_mtime + 10
+            os.utime(models_path, (later, later))
+            first.check_for_updates(url=url)
+            assert mock_get.call_count == 3
+
     def test_check_for_updates_with_explicit_url(self, simple_registry: ModelRegistry) -> None:
         """Test check_for_updates with custom URL."""
         # Create a mock config result with version information
@@ -376,25 +506,195 @@ class TestRegistryRefresh:
             patch.object(simple_registry, "_load_config", return_value=mock_config_result),
             patch.object(simple_registry._data_manager, "should_update_data", return_value=False),
             patch.object(simple_registry._data_manager, "_fetch_latest_data_release", return_value=None),
-            patch("requests.get") as mock_get,
+            patch.object(ModelRegistry, "_get_session") as mock_get_session,
         ):
+            mock_get = mock_get_session.return_value.get
             # Mock GET response
             get_response = MagicMock()
             get_response.status_code = 200
-            get_response.text = yaml.dump({"version": "2.0.0"})
+            get_response.content = yaml.dump({"version": "2.0.0"}).encode()
             mock_get.return_value = get_response
 
             # Use a custom URL to avoid default URL issues
             result = simple_registry.check_for_updates(url="https://example.com/test.yml")
 
             # Verify the request was made to the correct URL
-            mock_get.assert_called_once_with("https://example.com/test.yml", timeout=10)
+            mock_get.assert_called_once_with(
+                "https://example.com/test.yml", timeout=(3.05, 10), headers={"Range": "bytes=0-2047"}
+            )
 
             # Verify result
             assert result.success is True
             assert result.status == RefreshStatus.UPDATE_AVAILABLE
             assert "1.0.0 -> 2.0.0" in result.message
 
+    def test_check_for_updates_compares_typed_versions(self, simple_registry: ModelRegistry) -> None:
+        """Test that a plain numeric version compares like the locally parsed one."""
+        local = ConfigResult(success=True, data=yaml.safe_load("version: 1.10\nmodels: {}\n"), path="models.yaml")
+        with (
+            patch.object(simple_registry, "_load_config", return_value=local),
+            patch.object(simple_registry._data_manager, "should_update_data", return_value=False),
+            patch.object(ModelRegistry, "_get_session") as mock_get_session,
+        ):
+            mock_get_session.return_value.get.return_value = MagicMock(
+                status_code=200, content=b"version: 1.10\nmodels: {}\n"
+            )
+            result = simple_registry.check_for_updates(url="https://example.com/test.yml")
+
+        assert result.status == RefreshStatus.ALREADY_CURRENT
+
+    def test_check_for_updates_not_modified(self, simple_registry: ModelRegistry) -> None:
+        """Test that check_for_updates sends stored validators and honors 304."""
+        meta_path = simple_registry._get_metadata_path()
+        assert meta_path is not None
+        simple_registry._save_cache_metadata({"etag": '"abc123"', "last_modified": "Wed, 01 Jan 2025 00:00:00 GMT"})
+
+        with (
+            patch.object(simple_registry._data_manager, "should_update_data", return_value=False),
+            patch.object(simple_registry, "_load_config") as mock_load_config,
+            patch.object(ModelRegistry, "_get_session") as mock_get_session,
+        ):
+            mock_get = mock_get_session.return_value.get
+            mock_get.return_value = MagicMock(status_code=304)
+
+            result = simple_registry.check_for_updates(url="https://example.com/test.yml")
+
+            mock_get.assert_called_once_with(
+                "https://example.com/test.yml",
+                timeout=(3.05, 10),
+                headers={
+                    "If-None-Match": '"abc123"',
+                    "If-Modified-Since": "Wed, 01 Jan 2025 00:00:00 GMT",
+                    "Range": "bytes=0-2047",
+                },
+            )
+            mock_load_config.assert_not_called()
+            assert result.success is True
+            assert result.status == RefreshStatus.ALREADY_CURRENT
+
+    def test_check_for_updates_partial_content(self, simple_registry: ModelRegistry) -> None:
+        """Test that a ranged response is used and a truncated head falls back to a full fetch."""
+        head = MagicMock(status_code=206, content=b"version: 9.0.0\nmodels:\n  gpt-4o:\n    name: GP")
+        with (
+            patch.object(simple_registry._data_manager, "should_update_data", return_value=False),
+            patch.object(ModelRegistry, "_get_session") as mock_get_session,
+        ):
+            mock_get = mock_get_session.return_value.get
+            mock_get.return_value = head
+            result = simple_registry.check_for_updates(url="https://example.com/test.yml")
+
+            assert mock_get.call_count == 1
+            assert result.status == RefreshStatus.UPDATE_AVAILABLE
+            assert "9.0.0" in result.message
+
+            mock_get.reset_mock()
+            truncated = MagicMock(status_code=206, content=b"models:\n  gpt-4o:\n    name: GP")
+            full = MagicMock(status_code=200, content=b"models: {}\nversion: 9.0.0\n")
+            mock_get.side_effect = [truncated, full]
+            result = simple_registry.check_for_updates(url="https://example.com/test.yml")
+
+            assert mock_get.call_count == 2
+            assert "Range" not in mock_get.call_args.kwargs["headers"]
+            assert result.status == RefreshStatus.UPDATE_AVAILABLE
+
+            # A head cut inside the version value is not trusted either
+            mock_get.reset_mock()
+            cut = MagicMock(status_code=206, content=b"version: 1.0")
+            full = MagicMock(status_code=200, content=b"version: 1.0.0\nmodels: {}\n")
+            mock_get.side_effect = [cut, full]
+            result = simple_registry.check_for_updates(url="https://example.com/test.yml")
+
+            assert mock_get.call_count == 2
+            assert result.status == RefreshStatus.ALREADY_CURRENT
+
+    def test_check_for_updates_does_not_hold_lock_during_fetch(self, simple_registry: ModelRegistry) -> None:
+        """Test that other threads can take the registry lock while a check is fetching."""
+        lock_free: List[bool] = []
+
+        def fake_get(*args: object, **kwargs: object) -> MagicMock:
+            def probe() -> None:
+                acquired = ModelRegistry._instance_lock.acquire(timeout=1)
+                if acquired:
+                    ModelRegistry._instance_lock.release()
+                lock_free.append(acquired)
+
+            worker = threading.Thread(target=probe)
+            worker.start()
+            worker.join()
+            return MagicMock(status_code=304)
+
+        with (
+            patch.object(simple_registry._data_manager, "should_update_data", return_value=False),
+            patch.object(ModelRegistry, "_get_session") as mock_get_session,
+        ):
+            mock_get_session.return_value.get.side_effect = fake_get
+            result = simple_registry.check_for_updates(url="https://example.com/test.yml")
+
+        assert lock_free == [True]
+        assert result.status == RefreshStatus.ALREADY_CURRENT
+
+    def test_cache_metadata_is_json(self, simple_registry: ModelRegistry) -> None:
+        """Test that cache metadata is written as JSON and legacy YAML still loads."""
+        meta_path = simple_registry._get_metadata_path()
+        assert meta_path is not None
+
+        simple_registry._save_cache_metadata({"etag": '"v1"'})
+        with open(meta_path) as f:
+            assert json.load(f) == {"etag": '"v1"'}
+
+        with open(meta_path, "w") as f:
+            f.write("etag: '\"v0\"'\nlast_modified: Wed, 01 Jan 2025 00:00:00 GMT\n")
+        assert simple_registry._get_conditional_headers() == {
+            "If-None-Match": '"v0"',
+            "If-Modified-Since": "Wed, 01 Jan 2025 00:00:00 GMT",
+        }
+
+    def test_conditional_headers_cached_until_metadata_changes(self, simple_registry: ModelRegistry) -> None:
+        """Test that cache metadata is re-read only when the file changes."""
+        simple_registry._save_cache_metadata({"etag": '"v1"'})
+
+        # Saving primes the cache, so the file just written is not read back
+        with patch("builtins.open", side_effect=AssertionError("metadata re-read")):
+            assert simple_registry._get_conditional_headers() == {"If-None-Match": '"v1"'}
+
+        simple_registry._save_cache_metadata({"etag": '"v2-longer"'})
+        assert simple_registry._get_conditional_headers() == {"If-None-Match": '"v2-longer"'}
+
+        # Edits made outside the registry are picked up
+        meta_path = simple_registry._get_metadata_path()
+        assert meta_path is not None
+        with open(meta_path, "w") as f:
+            json.dump({"etag": '"v3-external"'}, f)
+        assert simple_registry._get_conditional_headers() == {"If-None-Match": '"v3-external"'}
+
+    def test_http_session_is_shared(self) -> None:
+        """Test that registry downloads reuse one pooled session with retries."""
+        original_session = ModelRegistry._http_session
+        ModelRegistry._http_session = None
+        try:
+            session = ModelRegistry._get_session()
+            assert ModelRegistry._get_session() is session
+
+            adapter = session.get_adapter("https://raw.githubusercontent.com/")
+            assert isinstance(adapter, requests.adapters.HTTPAdapter)
+            assert adapter.max_retries.total == 2
+            assert 503 in adapter.max_retries.status_forcelist
+        finally:
+            ModelRegistry._http_session = original_session
+
+    def test_auto_update_loads_capabilities_once(self, simple_registry: ModelRegistry) -> None:
+        """Test that a successful auto-update does not load capabilities twice."""
+        config = RegistryConfig(constraints_path=simple_registry.config.constraints_path, auto_update=True)
+
+        with (
+            patch.object(DataManager, "should_update_data", return_value=True),
+            patch.object(DataManager, "check_for_updates", return_value=True),
+            patch.object(ModelRegistry, "_load_capabilities", autospec=True) as mock_load,
+        ):
+            ModelRegistry(config)
+
+        assert mock_load.call_count == 1
+
     def test_check_for_updates_http_404(self) -> None:
         """Test check_for_updates with a 404 HTTP error using more direct mocking."""
         registry = ModelRegistry()
@@ -411,8 +711,9 @@ class TestRegistryRefresh:
             patch.object(registry, "_load_config", return_value=mock_config_result),
             patch.object(registry._data_manager, "should_update_data", return_value=False),
             patch.object(registry._data_manager, "_fetch_latest_data_release", return_value=None),
-            patch("requests.get") as mock_get,
+            patch.object(ModelRegistry, "_get_session") as mock_get_session,
         ):
+            mock_get = mock_get_session.return_value.get
             # Create a mock response with 404
             mock_response = MagicMock()
             mock_response.status_code = 404
@@ -432,13 +733,39 @@ class TestRegistryRefresh:
             # Check that the first call was to the specified URL
             first_call_args, first_call_kwargs = calls[0]
             assert first_call_args[0] == "https://test.example.com/config.yml"
-            assert first_call_kwargs.get("timeout") == 10
+            assert first_call_kwargs.get("timeout") == (3.05, 10)
 
             # Verify error handling
             assert result.success is False
             assert result.status == RefreshStatus.ERROR
             assert "could not fetch remote config" in result.message.lower()
 
+    def test_atomic_write_keeps_target_on_failure(self, tmp_path: Path) -> None:
+        """Test that registry file writes replace the target atomically."""
+        target = tmp_path / "models.yaml"
+        _write_text_atomic(target, "version: 1.0.0\n")
+        assert target.read_text() == "version: 1.0.0\n"
+
+        with patch("os.replace", side_effect=OSError("disk full")):
+            with pytest.raises(OSError):
+                _write_text_atomic(target, "version: 2.0.0\n")
+
+        # The original content survives and no temporary file is left behind
+        assert target.read_text() == "version: 1.0.0\n"
+        assert list(tmp_path.iterdir()) == [target]
+
+    def test_write_skipped_when_unchanged(self, tmp_path: Path) -> None:
+        """Test that identical content does not rewrite the target file."""
+        target = tmp_path / "models.yaml"
+        assert _write_bytes_if_changed(target, b"version: 1.0.0\n") is True
+
+        with patch("os.replace") as mock_replace:
+            assert _write_bytes_if_changed(target, b"version: 1.0.0\n") is False
+            mock_replace.assert_not_called()
+
+        assert _write_bytes_if_changed(target, b"version: 2.0.0\n") is True
+        assert target.read_bytes() == b"version: 2.0.0\n"
+
     def test_file_permission_error_handling(self) -> None:
         """Test file permission error handling in file writing operations."""
         with patch("builtins.open") as mock_open:
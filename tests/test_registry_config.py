@@ -3,6 +3,8 @@
 import os
 from unittest.mock import patch
 
+import pytest
+
 from openai_model_registry.registry import RegistryConfig
 
 
@@ -18,6 +20,7 @@ def test_registry_config_initialization() -> None:
         assert config.constraints_path == "/default/constraints.yml"
         assert config.auto_update is False
         assert config.cache_size == 100
+        assert config.refresh_ttl == 0
 
 
 def test_registry_config_custom_values() -> None:
@@ -27,11 +30,16 @@ def test_registry_config_custom_values() -> None:
         constraints_path="/custom/constraints.yml",
         auto_update=True,
         cache_size=500,
+        refresh_ttl=3600,
     )
     assert config.registry_path == "/custom/registry.yml"
     assert config.constraints_path == "/custom/constraints.yml"
     assert config.auto_update is True
     assert config.cache_size == 500
+    assert config.refresh_ttl == 3600
+
+    with pytest.raises(ValueError):
+        RegistryConfig(refresh_ttl=-1)
 
 
 def test_registry_config_mixed_values() -> None: